@@ -1,31 +1,33 @@
 # Configuration file for the Sphinx documentation builder.
 # https://www.sphinx-doc.org/en/master/usage/configuration.html
 
-import sys
+import re
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Add project root to sys.path so autodoc can import respyra even when the
-# package is not pip-installed (e.g., CI doc builds on Python 3.12).
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
-import respyra  # noqa: E402
+# Read the version statically — sphinx-autoapi parses the source instead of
+# importing respyra, so the doc build never imports the package.
+_root = Path(__file__).resolve().parent.parent
+_init = (_root / "respyra" / "__init__.py").read_text(encoding="utf-8")
+_version = re.search(r'^__version__ = "([^"]+)"', _init, re.MULTILINE).group(1)
 
 # -- Project information -----------------------------------------------------
 
 project = "respyra"
 author = "Micah Allen"
 copyright = "2026, Micah Allen"
-release = respyra.__version__
+release = _version
 
 # -- General configuration ---------------------------------------------------
 
 extensions = [
     "myst_parser",
-    "sphinx.ext.autodoc",
+    # viewcode must load first so autoapi can hook its source-lookup events
+    "sphinx.ext.viewcode",
+    "autoapi.extension",
     "sphinx.ext.napoleon",
     "sphinx.ext.intersphinx",
-    "sphinx.ext.viewcode",
-    "sphinx_autodoc_typehints",
     "sphinx_design",
 ]
 
@@ -41,20 +43,61 @@ napoleon_numpy_docstring = True
 napoleon_use_param = True
 napoleon_use_rtype = True
 
-# Autodoc
+# AutoAPI — the API pages in api/ are hand-written and use the
+# autoapimodule directive, so no pages are generated automatically.
+autoapi_type = "python"
+autoapi_dirs = ["../respyra"]
+autoapi_ignore = ["*/gdx/*"]
+autoapi_options = ["members", "undoc-members", "show-inheritance"]
+autoapi_generate_api_docs = False
+autoapi_add_toctree_entry = False
+# autoapimodule reuses autodoc's documenters, so ordering comes from autodoc
 autodoc_member_order = "bysource"
-autodoc_mock_imports = [
-    "psychopy",
-    "godirect",
-    "respyra.core.gdx",
-]
+# gdx is vendored and deliberately not parsed
+suppress_warnings = ["autoapi.python_import_resolution"]
+
+# Intersphinx — only projects the API pages actually cross-reference
+# (stdlib types, matplotlib.figure.Figure).  The pandas annotations are
+# written as ``pd.DataFrame`` and never resolve, and nothing links to numpy.
+_intersphinx_urls = {
+    "python": "https://docs.python.org/3",
+    "matplotlib": "https://matplotlib.org/stable/",
+}
+
+# Local copies of the objects.inv files survive `make clean`, so only the
+# first cold build pays for the downloads (fetched in parallel).
+_intersphinx_cache = Path(__file__).resolve().parent / "_intersphinx_cache"
+
+
+def _prefetch_intersphinx() -> None:
+    """Download any missing objects.inv files into ``_intersphinx_cache/``."""
+    missing = [
+        (url, _intersphinx_cache / f"{name}.inv")
+        for name, url in _intersphinx_urls.items()
+        if not (_intersphinx_cache / f"{name}.inv").exists()
+    ]
+    if not missing:
+        return
+
+    def fetch(item):
+        url, dest = item
+        try:
+            with urllib.request.urlopen(url.rstrip("/") + "/objects.inv", timeout=10) as resp:
+                dest.write_bytes(resp.read())
+        except OSError:
+            pass  # Sphinx falls back to the remote inventory
+
+    _intersphinx_cache.mkdir(exist_ok=True)
+    with ThreadPoolExecutor(max_workers=len(missing)) as pool:
+        list(pool.map(fetch, missing))
+
+
+_prefetch_intersphinx()
 
-# Intersphinx
+# Try the local copy first, then the remote inventory
 intersphinx_mapping = {
-    "python": ("https://docs.python.org/3", None),
-    "numpy": ("https://numpy.org/doc/stable/", None),
-    "pandas": ("https://pandas.pydata.org/docs/", None),
-    "matplotlib": ("https://matplotlib.org/stable/", None),
+    name: (url, (str(_intersphinx_cache / f"{name}.inv"), None))
+    for name, url in _intersphinx_urls.items()
 }
 
 # File suffixes
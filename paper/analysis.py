@@ -6,45 +6,214 @@ and per-trial statistics computation used by the paper figure scripts.
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
-from scipy.signal import find_peaks
 
 # -- Phase ordering (for session time reconstruction) ----------------------
 
 PHASE_ORDER = {"range_cal": 0, "baseline": 1, "countdown": 2, "tracking": 3}
 
 
+def phase_categorical(phase: pd.Series) -> pd.Series:
+    """Return *phase* as an ordered categorical whose codes follow PHASE_ORDER.
+
+    Phases not in :data:`PHASE_ORDER` are kept and sort after the known ones.
+    """
+    if isinstance(phase.dtype, pd.CategoricalDtype) and phase.cat.ordered:
+        return phase
+    extra = sorted(set(phase.dropna().unique()) - PHASE_ORDER.keys())
+    dtype = pd.CategoricalDtype([*PHASE_ORDER, *extra], ordered=True)
+    return phase.astype(dtype)
+
+
+# Numeric CSV columns stored as float32 by load_sessions
+# (timestamp stays float64: float32 drifts by ~1e-5 s over a session)
+FLOAT32_COLUMNS = (
+    "force_n",
+    "target_force",
+    "error",
+    "compensated_error",
+    "feedback_gain",
+)
+
+
+def _resolve_cache_dir() -> Path | None:
+    """Return the parquet cache directory, or ``None`` if caching is off.
+
+    Defaults to ``paper/.cache``.  The ``RESPYRA_PAPER_CACHE`` environment
+    variable overrides it; set it to an empty string to disable caching.
+    """
+    value = os.environ.get("RESPYRA_PAPER_CACHE")
+    if value is None:
+        return Path(__file__).parent / ".cache"
+    return Path(value).expanduser() if value else None
+
+
+# Parsed sessions and derived stats are cached here as parquet (see
+# load_sessions and pandas_disk_cache); resolved once at import
+CACHE_DIR = _resolve_cache_dir()
+
+# Cache entries kept per prefix (e.g. paper and validation session sets)
+CACHE_KEEP = 4
+
+# Session number in BIDS-style filenames (sub-X_ses-NNN_...)
+_SES_RE = re.compile(r"ses-(\d+)")
+
+
+# -- Result caching --------------------------------------------------------
+
+
+def _frame_fingerprint(*frames: pd.DataFrame) -> str:
+    """Hash the columns and row contents of one or more DataFrames.
+
+    This module's source is mixed in too, so editing the analysis code
+    invalidates previously cached results.
+    """
+    h = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=8)
+    for df in frames:
+        h.update(repr(list(df.columns)).encode())
+        h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def _write_cache(path: Path, df: pd.DataFrame) -> None:
+    """Store *df* at *path* and prune older entries with the same prefix.
+
+    Cache files are named ``<prefix>_<fingerprint>.parquet``; only the
+    :data:`CACHE_KEEP` most recent per prefix are kept, so stale
+    fingerprints do not pile up.  Skipped silently if no parquet engine is
+    installed.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(path)
+    except ImportError:
+        return
+    prefix = path.name.rsplit("_", 1)[0]
+    entries = sorted(
+        path.parent.glob(f"{prefix}_*.parquet"),
+        key=lambda p: p.stat().st_mtime,
+        reverse=True,
+    )
+    for stale in entries[CACHE_KEEP:]:
+        stale.unlink(missing_ok=True)
+
+
+def pandas_disk_cache(name: str, cache_dir: Path | None = None):
+    """Memoize a DataFrame -> DataFrame function as parquet under *cache_dir*.
+
+    *cache_dir* defaults to :data:`CACHE_DIR`, looked up on each call like
+    :func:`load_sessions` does, so caching is disabled when it is ``None``
+    (e.g. ``RESPYRA_PAPER_CACHE=""``).  The cache key is a fingerprint of
+    every DataFrame argument, so any change to the input data invalidates
+    it.  The decorated function takes an extra ``cache=False`` keyword to
+    bypass the cache for one call.  Falls through to a plain call if no
+    parquet engine is installed.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, cache: bool = True, **kwargs):
+            directory = cache_dir if cache_dir is not None else CACHE_DIR
+            if not cache or directory is None:
+                return func(*args, **kwargs)
+            frames = [a for a in (*args, *kwargs.values()) if isinstance(a, pd.DataFrame)]
+            cache_path = directory / f"{name}_{_frame_fingerprint(*frames)}.parquet"
+            if cache_path.exists():
+                try:
+                    return pd.read_parquet(cache_path)
+                except ImportError:
+                    pass
+            result = func(*args, **kwargs)
+            _write_cache(cache_path, result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
 # -- Data loading ----------------------------------------------------------
 
 
-def load_sessions(paths: list[str]) -> pd.DataFrame:
-    """Load and concatenate session CSVs, adding a ``session`` column."""
-    frames = []
+def _sessions_cache_path(paths: list[str]) -> Path:
+    """Return the parquet cache path keyed on each file's (path, mtime, size).
+
+    This module's source is part of the key so that changes to the loading
+    code (e.g. new derived columns) invalidate old caches.
+    """
+    key = []
     for p in sorted(paths):
-        df = pd.read_csv(p)
-        for col in (
-            "timestamp",
-            "frame",
-            "force_n",
-            "target_force",
-            "error",
-            "compensated_error",
-            "feedback_gain",
-        ):
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
-        if "trial_num" in df.columns:
-            df["trial_num"] = pd.to_numeric(df["trial_num"], errors="coerce").astype("Int64")
-        stem = Path(p).stem
-        ses_part = [x for x in stem.split("_") if x.startswith("ses-")]
-        ses_num = int(ses_part[0].replace("ses-", "")) if ses_part else len(frames) + 1
-        df["session"] = ses_num
-        frames.append(df)
-        print(f"  Loaded {p} (session {ses_num}, {len(df)} rows)")
-    return pd.concat(frames, ignore_index=True)
+        st = os.stat(p)
+        key.append((os.path.abspath(p), st.st_mtime_ns, st.st_size))
+    h = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=8)
+    h.update(repr(key).encode())
+    digest = h.hexdigest()
+    return CACHE_DIR / f"sessions_{digest}.parquet"
+
+
+def _session_number(path: str, order_index: int) -> int:
+    """Session number from the ``ses-NNN`` filename part, else ``order_index + 1``."""
+    m = _SES_RE.search(Path(path).stem)
+    return int(m.group(1)) if m else order_index + 1
+
+
+def _load_one(path: str, order_index: int) -> pd.DataFrame:
+    """Parse and type one session CSV (runs in a worker process)."""
+    # float32 is ample for 4-decimal sensor values and halves memory
+    # traffic in the groupby/agg passes downstream
+    dtype = {col: "float32" for col in FLOAT32_COLUMNS}
+    dtype["trial_num"] = "Int16"
+    try:
+        df = pd.read_csv(path, engine="pyarrow", dtype=dtype)
+    except ImportError:
+        df = pd.read_csv(path, dtype=dtype)
+    df["session"] = _session_number(path, order_index)
+    if "target_force" in df.columns and "phase" in df.columns:
+        df["is_inspiration"] = _label_tracking_breath_phase(df)
+    return df
+
+
+def load_sessions(paths: list[str], cache: bool = True) -> pd.DataFrame:
+    """Load and concatenate session CSVs, adding a ``session`` column.
+
+    Files are parsed in parallel worker processes.  With *cache* enabled (and
+    :data:`CACHE_DIR` set) the parsed frame is stored as parquet there, so
+    re-runs on unchanged files skip CSV parsing.
+    Caching is skipped silently if no parquet engine is installed.
+    """
+    cache_path = _sessions_cache_path(paths) if cache and CACHE_DIR is not None else None
+    if cache_path is not None and cache_path.exists():
+        try:
+            df = pd.read_parquet(cache_path)
+        except ImportError:
+            pass
+        else:
+            print(f"  Loaded {len(paths)} session(s) from cache {cache_path}")
+            return df
+
+    paths = sorted(paths)
+    if len(paths) > 1:
+        workers = min(len(paths), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            frames = list(ex.map(_load_one, paths, range(len(paths))))
+    else:
+        frames = [_load_one(p, i) for i, p in enumerate(paths)]
+    for i, (p, df) in enumerate(zip(paths, frames, strict=True)):
+        print(f"  Loaded {p} (session {_session_number(p, i)}, {len(df)} rows)")
+    df = pd.concat(frames, ignore_index=True)
+    df["phase"] = phase_categorical(df["phase"])
+
+    if cache_path is not None:
+        _write_cache(cache_path, df)
+    return df
 
 
 def build_session_time(df: pd.DataFrame) -> pd.Series:
@@ -53,31 +222,33 @@ def build_session_time(df: pd.DataFrame) -> pd.Series:
     Sorts internally by ``(trial_num, phase_order, timestamp)``, computes
     cumulative elapsed time, then maps back to the caller's index.
     """
-    work = df[["phase", "trial_num", "timestamp"]].copy()
-    work["_phase_ord"] = work["phase"].map(PHASE_ORDER).fillna(9)
-    sorted_idx = work.sort_values(["trial_num", "_phase_ord", "timestamp"]).index
-
-    session_time = np.zeros(len(sorted_idx))
-    offset = 0.0
-    prev_phase = None
-    prev_trial = None
-
-    for pos, orig_i in enumerate(sorted_idx):
-        row = work.loc[orig_i]
-        phase = row["phase"]
-        trial = row["trial_num"]
-        ts = row["timestamp"] if not pd.isna(row["timestamp"]) else 0.0
-        if phase != prev_phase or trial != prev_trial:
-            if pos > 0:
-                offset = session_time[pos - 1] + 0.5
-            prev_phase = phase
-            prev_trial = trial
-        session_time[pos] = offset + ts
-
-    # Map computed times back to the original index order
-    result = pd.Series(index=df.index, dtype=float)
-    result.loc[sorted_idx] = session_time
-    return result
+    phase_ord = phase_categorical(df["phase"]).cat.codes.to_numpy()
+    phase_ord = np.where(phase_ord < 0, phase_ord.max(initial=0) + 1, phase_ord)  # missing last
+    work = pd.DataFrame(
+        {
+            "trial_num": df["trial_num"].to_numpy(),
+            "_phase_ord": phase_ord,
+            "timestamp": df["timestamp"].to_numpy(),
+        }
+    )
+    order = work.sort_values(["trial_num", "_phase_ord", "timestamp"]).index.to_numpy()
+
+    # Each (trial, phase) run in sorted order starts a new segment that is
+    # placed 0.5 s after the final sample of the previous segment.
+    phase_codes = pd.factorize(df["phase"])[0][order]
+    trial_codes = pd.factorize(df["trial_num"])[0][order]
+    ts = np.nan_to_num(work["timestamp"].to_numpy(dtype=float)[order], nan=0.0)
+
+    new_group = np.zeros(len(order), dtype=bool)
+    new_group[1:] = (phase_codes[1:] != phase_codes[:-1]) | (trial_codes[1:] != trial_codes[:-1])
+    group_id = np.cumsum(new_group)
+    group_end_ts = ts[np.append(np.flatnonzero(new_group) - 1, len(ts) - 1)] if len(ts) else ts
+    offsets = np.concatenate([[0.0], np.cumsum(group_end_ts[:-1] + 0.5)])
+
+    # Map computed times back to the original row order
+    session_time = np.empty(len(order))
+    session_time[order] = offsets[group_id] + ts
+    return pd.Series(session_time, index=df.index)
 
 
 # -- Respiratory metrics ---------------------------------------------------
@@ -106,10 +277,12 @@ def detect_breath_peaks(
         Indices of inspiration peaks (local maxima) and expiration troughs
         (local minima).
     """
+    from scipy.signal import find_peaks
+
     force = np.asarray(force, dtype=float)
     min_dist = int(min_cycle_sec * sampling_rate * 0.7)
     # Prominence threshold: reject peaks smaller than 10% of the signal range
-    signal_range = force.max() - force.min()
+    signal_range = np.ptp(force)
     prom = max(0.05, signal_range * 0.1)
     peaks, _ = find_peaks(force, distance=min_dist, prominence=prom)
     troughs, _ = find_peaks(-force, distance=min_dist, prominence=prom)
@@ -151,13 +324,12 @@ def compute_respiratory_metrics(
         result["cycle_duration_cv"] = cycle_durations.std() / cycle_durations.mean()
 
     # Breathing depth: pair each peak with the nearest preceding trough
-    depths = []
-    for pk in peaks:
-        preceding = troughs[troughs < pk]
-        if len(preceding) > 0:
-            depths.append(force[pk] - force[preceding[-1]])
-    if depths:
-        result["breathing_depth_n"] = float(np.mean(depths))
+    force = np.asarray(force, dtype=float)
+    j = np.searchsorted(troughs, peaks, side="left") - 1
+    valid = j >= 0
+    depths = force[peaks[valid]] - force[troughs[j[valid]]]
+    if depths.size:
+        result["breathing_depth_n"] = float(depths.mean())
 
     return result
 
@@ -166,72 +338,115 @@ def compute_respiratory_metrics(
 
 
 def label_breath_phase(target_force: np.ndarray) -> np.ndarray:
-    """Label each sample as ``'inspiration'`` or ``'expiration'``.
+    """Return a boolean mask that is ``True`` for inspiration samples.
 
-    Uses the derivative of the target sinusoid: positive (target rising) =
-    inspiration, negative (target falling) = expiration.
+    Uses the slope of the target sinusoid: rising target = inspiration,
+    otherwise expiration.  Only the sign of the central difference matters,
+    so it is taken as a direct comparison (one-sided at the ends, as in
+    :func:`numpy.gradient`) without computing the derivative itself.
+    """
+    target_force = np.asarray(target_force)
+    is_insp = np.zeros(target_force.size, dtype=bool)
+    if target_force.size < 2:
+        return is_insp
+    np.greater(target_force[2:], target_force[:-2], out=is_insp[1:-1])
+    is_insp[0] = target_force[1] > target_force[0]
+    is_insp[-1] = target_force[-1] > target_force[-2]
+    return is_insp
+
+
+def _label_tracking_breath_phase(df: pd.DataFrame) -> pd.Series:
+    """Label tracking-phase rows of one session, trial by trial.
+
+    The derivative is taken within each trial so it never spans a trial
+    boundary.  Returns a nullable boolean Series that is missing outside
+    the tracking phase.
     """
-    gradient = np.gradient(np.asarray(target_force, dtype=float))
-    return np.where(gradient > 0, "inspiration", "expiration")
+    is_insp = pd.Series(pd.NA, index=df.index, dtype="boolean")
+    tracking = df[df["phase"] == "tracking"]
+    target = tracking["target_force"].to_numpy(dtype=float)
+    positions = df.index.get_indexer(tracking.index)
+    for idx in tracking.groupby("trial_num", sort=False).indices.values():
+        is_insp.iloc[positions[idx]] = label_breath_phase(target[idx])
+    return is_insp
 
 
 # -- Trial statistics ------------------------------------------------------
 
 
+@pandas_disk_cache("trial_stats")
 def compute_trial_stats(df: pd.DataFrame) -> pd.DataFrame:
     """Compute per-trial MAE, respiratory metrics, and breath-phase errors.
 
     Operates on tracking-phase data only. Returns one row per
     ``(session, trial_num)``.
     """
-    tracking = df[df["phase"] == "tracking"].copy()
-    tracking["abs_error"] = tracking["error"].abs()
-    tracking["abs_comp_error"] = tracking["compensated_error"].abs()
-    tracking["breath_phase"] = label_breath_phase(tracking["target_force"].values)
-
-    rows = []
-    for (sess, tnum, cond, gain), grp in tracking.groupby(
-        ["session", "trial_num", "condition", "feedback_gain"]
-    ):
-        force = grp["force_n"].dropna().values
-        resp = compute_respiratory_metrics(force)
-
-        insp = grp[grp["breath_phase"] == "inspiration"]
-        exp = grp[grp["breath_phase"] == "expiration"]
+    keys = ["session", "trial_num", "condition", "feedback_gain"]
+    # Select only the columns used below so the subset copy stays narrow,
+    # then add the derived columns in a single assign
+    mask = (df["phase"] == "tracking").to_numpy()
+    cols = keys + ["force_n", "error", "compensated_error", "target_force"]
+    if "is_inspiration" in df.columns:
+        cols.append("is_inspiration")
+    tracking = df.loc[mask, cols]
+    derived = {
+        "abs_error": tracking["error"].abs(),
+        "abs_comp_error": tracking["compensated_error"].abs(),
+    }
+    if "is_inspiration" not in tracking.columns:
+        derived["is_inspiration"] = label_breath_phase(tracking["target_force"].to_numpy())
+    tracking = tracking.assign(**derived)
+
+    grouped = tracking.groupby(keys)
+    trials = grouped.agg(
+        raw_mae=("abs_error", "mean"),
+        raw_sd=("abs_error", "std"),
+        comp_mae=("abs_comp_error", "mean"),
+        comp_sd=("abs_comp_error", "std"),
+    )
+
+    # Breath-phase MAEs: one grouped mean, pivoted on inspiration/expiration
+    phase_mae = (
+        tracking.groupby(keys + ["is_inspiration"])[["abs_error", "abs_comp_error"]]
+        .mean()
+        .unstack("is_inspiration")
+        .reindex(trials.index)
+    )
+    for prefix, is_insp in (("insp", True), ("exp", False)):
+        for metric, col in (("raw", "abs_error"), ("comp", "abs_comp_error")):
+            key = (col, is_insp)
+            trials[f"{prefix}_{metric}_mae"] = (
+                phase_mae[key] if key in phase_mae.columns else np.nan
+            )
+
+    # Respiratory metrics need peak detection, so stay per-trial
+    resp = pd.DataFrame(
+        [
+            compute_respiratory_metrics(force.dropna().to_numpy(dtype=np.float64))
+            for _, force in grouped["force_n"]
+        ],
+        index=trials.index,
+    )
+    trials = trials.join(resp)
+    trials["n_samples"] = grouped.size()
+    trials = trials.reset_index()
 
-        rows.append(
-            {
-                "session": sess,
-                "trial_num": tnum,
-                "condition": cond,
-                "feedback_gain": gain,
-                "raw_mae": grp["abs_error"].mean(),
-                "raw_sd": grp["abs_error"].std(),
-                "comp_mae": grp["abs_comp_error"].mean(),
-                "comp_sd": grp["abs_comp_error"].std(),
-                "insp_raw_mae": insp["abs_error"].mean() if len(insp) else np.nan,
-                "insp_comp_mae": insp["abs_comp_error"].mean() if len(insp) else np.nan,
-                "exp_raw_mae": exp["abs_error"].mean() if len(exp) else np.nan,
-                "exp_comp_mae": exp["abs_comp_error"].mean() if len(exp) else np.nan,
-                "breathing_rate_bpm": resp["breathing_rate_bpm"],
-                "breathing_depth_n": resp["breathing_depth_n"],
-                "n_complete_cycles": resp["n_complete_cycles"],
-                "cycle_duration_cv": resp["cycle_duration_cv"],
-                "n_samples": len(grp),
-            }
-        )
+    # Within-block trial index (1-N within each condition per session)
+    trials["block_trial"] = trials.groupby(["session", "condition"]).cumcount() + 1
 
-    trials = pd.DataFrame(rows)
+    # Published stats keep the float64/int64 dtypes regardless of the
+    # narrower load dtypes
+    float_cols = trials.select_dtypes("float32").columns
+    trials[float_cols] = trials[float_cols].astype(np.float64)
+    trials["trial_num"] = trials["trial_num"].astype(np.int64)
 
-    # Within-block trial index (1-N within each condition per session)
-    for sess in trials["session"].unique():
-        for cond in trials["condition"].unique():
-            mask = (trials["session"] == sess) & (trials["condition"] == cond)
-            trials.loc[mask, "block_trial"] = range(1, mask.sum() + 1)
+    # Figure code filters on condition repeatedly; categorical compares codes
+    trials["condition"] = trials["condition"].astype("category")
 
     return trials
 
 
+@pandas_disk_cache("session_stats")
 def compute_session_stats(df: pd.DataFrame, trials: pd.DataFrame) -> pd.DataFrame:
     """Compute per-session summary statistics for Table 1.
 
@@ -242,20 +457,16 @@ def compute_session_stats(df: pd.DataFrame, trials: pd.DataFrame) -> pd.DataFram
     trials : pd.DataFrame
         Per-trial stats from :func:`compute_trial_stats`.
     """
+    # Session duration: sum of the max timestamp of every (trial, phase)
+    # group, computed for all sessions in one grouped pass
+    phase_durations = df.groupby(["session", "trial_num", "phase"], observed=True)[
+        "timestamp"
+    ].max()
+    total_sec = phase_durations.groupby(level="session").sum()
+
     rows = []
     for sess, st in trials.groupby("session"):
-        sess_df = df[df["session"] == sess]
-
-        # Duration from last timestamp in last phase of last trial
-        sess_sorted = sess_df.copy()
-        sess_sorted["_phase_ord"] = sess_sorted["phase"].map(PHASE_ORDER).fillna(9)
-        sess_sorted = sess_sorted.sort_values(["trial_num", "_phase_ord", "timestamp"])
-        # Sum max timestamp per (trial, phase) group + inter-phase gaps
-        phase_durations = (
-            sess_sorted.groupby(["trial_num", "phase"])["timestamp"].max().reset_index()
-        )
-        total_sec = phase_durations["timestamp"].sum()
-        duration_min = total_sec / 60.0
+        duration_min = total_sec.get(sess, 0.0) / 60.0
 
         slow = st[st["condition"] == "slow_steady"]
         pert = st[st["condition"] == "perturbed_slow"]
@@ -20,23 +20,20 @@ Design rationale:
 
 from __future__ import annotations
 
+import functools
 import glob
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-import matplotlib
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-from scipy import stats
-
-matplotlib.use("Agg")
 
 sys.path.insert(0, str(Path(__file__).parent))
 from analysis import (  # noqa: E402
     compute_session_stats,
     compute_trial_stats,
-    label_breath_phase,
     load_sessions,
 )
 
@@ -64,24 +61,92 @@ COND_LABELS = {"slow_steady": "Veridical", "perturbed_slow": "Perturbed (2\u00d7
 
 SESSION_COLORS = ["#66bb6a", "#42a5f5", "#ffa726", "#ef5350"]  # S1-S4
 
+# Session whose trials Figure 1 shows
+REP_SESSION = 2
+
+# Columns of the tracking rows Figure 1 draws from
+EXAMPLE_TRIAL_COLUMNS = [
+    "trial_num",
+    "condition",
+    "timestamp",
+    "force_n",
+    "target_force",
+    "compensated_error",
+    "is_inspiration",
+]
+
+# Normal density normalisation for the Figure 1 reference curve
+_INV_SQRT_2PI = 1.0 / np.sqrt(2.0 * np.pi)
+
+
+# Dark theme for the paper figures, applied per figure by :func:`_themed`
+# so it never leaks into other figures drawn in the same process (Figure 4
+# is styled by respyra's plot_session)
+PAPER_RC = {
+    "figure.facecolor": BG_COLOR,
+    "axes.facecolor": PANEL_BG,
+    "axes.edgecolor": SPINE_COLOR,
+    "axes.titlecolor": TEXT_COLOR,
+    "axes.titlesize": 11,
+    "axes.titleweight": "bold",
+    "axes.titlepad": 8,
+    "axes.labelcolor": TEXT_COLOR,
+    "axes.labelsize": 10,
+    "axes.grid": True,
+    "grid.alpha": GRID_ALPHA,
+    "grid.color": "white",
+    "xtick.color": TICK_COLOR,
+    "ytick.color": TICK_COLOR,
+    "xtick.labelsize": 9,
+    "ytick.labelsize": 9,
+}
+
+
+@functools.cache
+def _pyplot():
+    """Import pyplot on first use, selecting the non-interactive Agg backend.
+
+    matplotlib (and scipy, imported in the figure functions) are only
+    loaded when a figure is actually drawn, so Table 1 does not pay for them.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+def _themed(func):
+    """Draw the figure made by *func* under :data:`PAPER_RC`."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _pyplot().rc_context(PAPER_RC):
+            return func(*args, **kwargs)
+
+    return wrapper
+
 
 def style_ax(ax, title="", xlabel="", ylabel=""):
-    """Apply dark theme styling to an axes."""
-    ax.set_facecolor(PANEL_BG)
-    ax.set_title(title, color=TEXT_COLOR, fontsize=11, fontweight="bold", pad=8)
-    ax.set_xlabel(xlabel, color=TEXT_COLOR, fontsize=10)
-    ax.set_ylabel(ylabel, color=TEXT_COLOR, fontsize=10)
-    ax.tick_params(colors=TICK_COLOR, labelsize=9)
-    for spine in ax.spines.values():
-        spine.set_color(SPINE_COLOR)
-    ax.grid(True, alpha=GRID_ALPHA, color="white")
+    """Set axes labels; the dark theme itself comes from :data:`PAPER_RC`."""
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
 
 
 def save_fig(fig, name):
     path = OUT_DIR / name
-    fig.savefig(path, dpi=200, bbox_inches="tight", facecolor=fig.get_facecolor())
+    # No "Software" tag: output bytes do not depend on the matplotlib version
+    fig.savefig(
+        path,
+        dpi=200,
+        bbox_inches="tight",
+        facecolor=fig.get_facecolor(),
+        metadata={"Software": None},
+    )
     print(f"  Saved: {path}")
-    plt.close(fig)
+    _pyplot().close(fig)
 
 
 # ======================================================================
@@ -179,51 +244,90 @@ def generate_table1(session_stats: pd.DataFrame) -> None:
 # ======================================================================
 
 
-def _pick_representative_trial(trials, session, condition):
-    """Pick the trial closest to the session-condition median visual MAE."""
-    sub = trials[(trials["session"] == session) & (trials["condition"] == condition)]
-    median_mae = sub["comp_mae"].median()
-    idx = (sub["comp_mae"] - median_mae).abs().idxmin()
-    return int(sub.loc[idx, "trial_num"])
+def _pick_representative_trial(comp_mae, trial_nums):
+    """Pick the trial whose visual MAE is closest to the median of *comp_mae*."""
+    return int(trial_nums[np.nanargmin(np.abs(comp_mae - np.nanmedian(comp_mae)))])
+
+
+def _error_stats(err: np.ndarray) -> tuple[float, float, float]:
+    """Return ``(MAE, RMSE, SD)`` of *err*, accumulated in float64."""
+    err = np.asarray(err, dtype=np.float64)
+    mae = np.abs(err).mean()
+    rmse = np.sqrt(err @ err / err.size)
+    return float(mae), float(rmse), float(err.std())
+
 
+def example_trial_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """Tracking rows of :data:`REP_SESSION`, narrowed to what Figure 1 draws."""
+    mask = (df["phase"] == "tracking") & (df["session"] == REP_SESSION)
+    return df.loc[mask, EXAMPLE_TRIAL_COLUMNS]
 
-def plot_example_trials(df: pd.DataFrame, trials: pd.DataFrame) -> None:
-    """2×3: representative veridical (top) and perturbed (bottom) trial traces."""
+
+@_themed
+def plot_example_trials(tracking: pd.DataFrame, trials: pd.DataFrame) -> None:
+    """2×3: representative veridical (top) and perturbed (bottom) trial traces.
+
+    *tracking* is the output of :func:`example_trial_rows`.
+    """
+    from matplotlib.collections import LineCollection
+    from matplotlib.colors import to_rgba_array
+
+    plt = _pyplot()
     fig, axes = plt.subplots(2, 3, figsize=(16, 8))
-    fig.patch.set_facecolor(BG_COLOR)
 
-    rep_session = 2
     trial_configs = [
         ("slow_steady", "A  Veridical Trial", COLOR_SLOW),
         ("perturbed_slow", "B  Perturbed Trial (2\u00d7 gain)", COLOR_PERT),
     ]
 
-    tracking = df[(df["phase"] == "tracking") & (df["session"] == rep_session)].copy()
-    tracking["breath_phase"] = label_breath_phase(tracking["target_force"].values)
+    # is_inspiration is labelled per trial by load_sessions.  Index once by
+    # (trial, condition) so each row below is a lookup, not two mask scans.
+    tracking = tracking.set_index(["trial_num", "condition"]).sort_index()
+
+    # (session, condition) -> (comp_mae, trial_num) arrays for trial picking
+    cell_trials = {
+        key: (g["comp_mae"].to_numpy(), g["trial_num"].to_numpy())
+        for key, g in trials.groupby(["session", "condition"], observed=True)
+    }
+
+    # RGBA lookup indexed by is_inspiration (0 = expiration, 1 = inspiration)
+    phase_rgba = to_rgba_array([COLOR_EXP, COLOR_INSP])
 
     for row, (cond, row_title, _cond_color) in enumerate(trial_configs):
-        tnum = _pick_representative_trial(trials, rep_session, cond)
-        grp = tracking[(tracking["trial_num"] == tnum) & (tracking["condition"] == cond)].copy()
+        tnum = _pick_representative_trial(*cell_trials[(REP_SESSION, cond)])
+        grp = tracking.loc[[(tnum, cond)]]
 
         t_sec = grp["timestamp"].values
         force = grp["force_n"].values
         target = grp["target_force"].values
         comp_err = grp["compensated_error"].values
-        phase = grp["breath_phase"].values
+        is_insp = grp["is_inspiration"].to_numpy(dtype=bool)
 
-        ce = comp_err[~np.isnan(comp_err)]
-        mae = np.mean(np.abs(ce))
-        rmse = np.sqrt(np.mean(ce**2))
+        valid = ~np.isnan(comp_err)
+        ce = comp_err[valid]
+        mae, rmse, sd = _error_stats(ce)
         ratio = rmse / mae if mae > 0 else 0
 
         # -- Col 1: Breathing trace --
         ax = axes[row, 0]
         style_ax(ax, row_title, xlabel="Time (s)", ylabel="Force (N)")
 
-        # Breath phase shading
-        for i in range(len(t_sec) - 1):
-            color = COLOR_INSP if phase[i] == "inspiration" else COLOR_EXP
-            ax.axvspan(t_sec[i], t_sec[i + 1], color=color, alpha=0.08)
+        # Breath phase shading, full axes height, one fill per phase.  Sample
+        # interval i is shaded by is_insp[i], so each fill also takes in the
+        # sample that closes its last interval.
+        for in_phase, color in ((is_insp[:-1], COLOR_INSP), (~is_insp[:-1], COLOR_EXP)):
+            where = np.zeros(len(t_sec), dtype=bool)
+            where[:-1] |= in_phase
+            where[1:] |= in_phase
+            ax.fill_between(
+                t_sec,
+                0,
+                1,
+                where=where,
+                color=color,
+                alpha=0.08,
+                transform=ax.get_xaxis_transform(),
+            )
 
         ax.plot(t_sec, target, color=COLOR_TARGET, linewidth=1.2, alpha=0.7, label="Target")
         ax.plot(t_sec, force, color=COLOR_FORCE, linewidth=0.8, alpha=0.9, label="Breathing")
@@ -244,26 +348,37 @@ def plot_example_trials(df: pd.DataFrame, trials: pd.DataFrame) -> None:
             ylabel="Visual Error (N)",
         )
 
-        for i in range(len(t_sec) - 1):
-            color = COLOR_INSP if phase[i] == "inspiration" else COLOR_EXP
-            ax.plot(t_sec[i : i + 2], comp_err[i : i + 2], color=color, linewidth=0.8, alpha=0.8)
-
-        ax.axhline(0, color=TICK_COLOR, linewidth=0.5, alpha=0.5)
-        ax.axhline(mae, color=TEXT_COLOR, linewidth=0.5, alpha=0.3, linestyle=":")
-        ax.axhline(-mae, color=TEXT_COLOR, linewidth=0.5, alpha=0.3, linestyle=":")
+        # One two-point segment per sample interval, coloured by breath phase
+        pts = np.column_stack([t_sec, comp_err])
+        segs = np.stack([pts[:-1], pts[1:]], axis=1)
+        seg_colors = phase_rgba[is_insp[:-1].astype(np.intp)]
+        ax.add_collection(LineCollection(segs, colors=seg_colors, linewidths=0.8, alpha=0.8))
+        ax.autoscale_view()
+
+        # Zero and +/-MAE reference lines across the full axes width
+        ax.hlines(
+            [0, mae, -mae],
+            0,
+            1,
+            colors=[TICK_COLOR, TEXT_COLOR, TEXT_COLOR],
+            linewidths=0.5,
+            alpha=[0.5, 0.3, 0.3],
+            linestyles=["-", ":", ":"],
+            transform=ax.get_yaxis_transform(),
+        )
 
         # -- Col 3: Error histogram --
         ax = axes[row, 2]
         style_ax(ax, "Error Distribution", xlabel="Visual Error (N)", ylabel="Density")
 
-        insp_err = comp_err[phase == "inspiration"]
-        exp_err = comp_err[phase == "expiration"]
-        all_err = np.concatenate([insp_err[~np.isnan(insp_err)], exp_err[~np.isnan(exp_err)]])
-        bins = np.linspace(all_err.min() * 1.1, all_err.max() * 1.1, 50)
+        insp_err = comp_err[valid & is_insp]
+        exp_err = comp_err[valid & ~is_insp]
+        hist_range = (ce.min() * 1.1, ce.max() * 1.1)
 
         ax.hist(
-            insp_err[~np.isnan(insp_err)],
-            bins=bins,
+            insp_err,
+            bins=49,
+            range=hist_range,
             density=True,
             color=COLOR_INSP,
             alpha=0.6,
@@ -271,8 +386,9 @@ def plot_example_trials(df: pd.DataFrame, trials: pd.DataFrame) -> None:
             edgecolor="none",
         )
         ax.hist(
-            exp_err[~np.isnan(exp_err)],
-            bins=bins,
+            exp_err,
+            bins=49,
+            range=hist_range,
             density=True,
             color=COLOR_EXP,
             alpha=0.6,
@@ -282,11 +398,10 @@ def plot_example_trials(df: pd.DataFrame, trials: pd.DataFrame) -> None:
         ax.axvline(0, color=TICK_COLOR, linewidth=0.8, alpha=0.5)
 
         # Normal reference
-        x_norm = np.linspace(bins[0], bins[-1], 200)
-        sd = np.std(ce)
+        x_norm = np.linspace(*hist_range, 200)
         ax.plot(
             x_norm,
-            stats.norm.pdf(x_norm, 0, sd),
+            np.exp(-0.5 * (x_norm / sd) ** 2) * (_INV_SQRT_2PI / sd),
             color=TEXT_COLOR,
             linewidth=1,
             alpha=0.4,
@@ -311,28 +426,61 @@ def plot_example_trials(df: pd.DataFrame, trials: pd.DataFrame) -> None:
 # ======================================================================
 
 
-def plot_session_performance(df: pd.DataFrame, trials: pd.DataFrame) -> None:
+def _plot_session_curves(ax, block, metric, sessions):
+    """Draw per-session within-block curves as one LineCollection and one scatter.
+
+    Returns one legend proxy per session.
+    """
+    from matplotlib.collections import LineCollection
+    from matplotlib.lines import Line2D
+
+    colors = SESSION_COLORS[: len(sessions)]
+    curves = [
+        block.loc[block["session"] == s, ["block_trial", metric]].to_numpy(dtype=float)
+        for s in sessions
+    ]
+    ax.add_collection(LineCollection(curves, colors=colors, linewidths=1, alpha=0.5))
+    points = np.concatenate(curves)
+    ax.scatter(
+        points[:, 0],
+        points[:, 1],
+        color=np.repeat(colors, [len(c) for c in curves]),
+        s=25,
+        alpha=0.5,
+        zorder=2,
+    )
+    return [
+        Line2D([], [], color=c, marker="o", linewidth=1, markersize=5, alpha=0.5, label=f"S{s}")
+        for c, s in zip(colors, sessions, strict=True)
+    ]
+
+
+@_themed
+def plot_session_performance(trials: pd.DataFrame) -> None:
     """2×2: session MAE + perturbation ratio (top), within-block by condition (bottom)."""
+    from scipy import stats
+
+    plt = _pyplot()
     fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-    fig.patch.set_facecolor(BG_COLOR)
 
     sessions = sorted(trials["session"].unique())
+    # One generator for all jitter so sessions get independent offsets
+    rng = np.random.default_rng(42)
+
+    # Session x condition visual MAE summary, shared by panels A and B
+    cell = trials.groupby(["session", "condition"], observed=True)["comp_mae"].agg(["mean", "sem"])
+    cell_means = cell["mean"].unstack("condition").reindex(index=sessions, columns=[*COND_COLORS])
+    cell_sems = cell["sem"].unstack("condition").reindex(index=sessions, columns=[*COND_COLORS])
 
     # -- Top-left: Visual MAE by session --
     ax = axes[0, 0]
     style_ax(ax, "A  Visual MAE by Session", xlabel="Session", ylabel="Visual MAE (N)")
 
     for cond, color in COND_COLORS.items():
-        means = []
-        sems = []
-        for s in sessions:
-            vals = trials[(trials["session"] == s) & (trials["condition"] == cond)]["comp_mae"]
-            means.append(vals.mean())
-            sems.append(vals.sem())
         ax.errorbar(
             sessions,
-            means,
-            yerr=sems,
+            cell_means[cond].to_numpy(),
+            yerr=cell_sems[cond].to_numpy(),
             fmt="o-",
             color=color,
             linewidth=2,
@@ -341,12 +489,16 @@ def plot_session_performance(df: pd.DataFrame, trials: pd.DataFrame) -> None:
             label=COND_LABELS[cond],
         )
         # Individual trial dots
-        for s in sessions:
-            vals = trials[(trials["session"] == s) & (trials["condition"] == cond)]["comp_mae"]
-            jitter = np.random.default_rng(42).uniform(-0.08, 0.08, len(vals))
-            ax.scatter(
-                [s] * len(vals) + jitter, vals, color=color, s=15, alpha=0.3, edgecolors="none"
-            )
+        cond_trials = trials[trials["condition"] == cond]
+        x = cond_trials["session"].to_numpy(dtype=float)
+        ax.scatter(
+            x + rng.uniform(-0.08, 0.08, x.size),
+            cond_trials["comp_mae"],
+            color=color,
+            s=15,
+            alpha=0.3,
+            edgecolors="none",
+        )
 
     ax.set_xticks(sessions)
     ax.legend(fontsize=9, facecolor=PANEL_BG, edgecolor=SPINE_COLOR, labelcolor=TEXT_COLOR)
@@ -360,37 +512,24 @@ def plot_session_performance(df: pd.DataFrame, trials: pd.DataFrame) -> None:
         ylabel="Perturbed / Veridical MAE",
     )
 
-    ratio_means = []
-    all_trial_ratios = []
-    for s in sessions:
-        v_mean = trials[(trials["session"] == s) & (trials["condition"] == "slow_steady")][
-            "comp_mae"
-        ].mean()
-        p_vals = trials[(trials["session"] == s) & (trials["condition"] == "perturbed_slow")][
-            "comp_mae"
-        ]
-        session_ratio = p_vals.mean() / v_mean
-        ratio_means.append(session_ratio)
-        # Per-trial ratios
-        for v in p_vals:
-            all_trial_ratios.append({"session": s, "ratio": v / v_mean})
-
-    tr = pd.DataFrame(all_trial_ratios)
+    verid_means = cell_means["slow_steady"]
+    ratio_means = (cell_means["perturbed_slow"] / verid_means).to_list()
+    # Per-trial ratios against the session's veridical mean
+    pert_trials = trials[trials["condition"] == "perturbed_slow"]
+    pert_sessions = pert_trials["session"].to_numpy()
+    trial_ratios = pert_trials["comp_mae"].to_numpy() / verid_means.loc[pert_sessions].to_numpy()
 
     ax.plot(sessions, ratio_means, "o-", color=COLOR_RATIO, linewidth=2.5, markersize=9, zorder=4)
 
-    for s in sessions:
-        vals = tr[tr["session"] == s]["ratio"]
-        jitter = np.random.default_rng(42).uniform(-0.1, 0.1, len(vals))
-        ax.scatter(
-            [s] * len(vals) + jitter,
-            vals,
-            color=COLOR_RATIO,
-            s=25,
-            alpha=0.4,
-            edgecolors="none",
-            zorder=3,
-        )
+    ax.scatter(
+        pert_sessions + rng.uniform(-0.1, 0.1, pert_sessions.size),
+        trial_ratios,
+        color=COLOR_RATIO,
+        s=25,
+        alpha=0.4,
+        edgecolors="none",
+        zorder=3,
+    )
 
     ax.axhline(1.0, color=TICK_COLOR, linewidth=1, alpha=0.5, linestyle=":")
     ax.text(sessions[0] - 0.1, 1.05, "no cost", color=TICK_COLOR, fontsize=8)
@@ -419,21 +558,10 @@ def plot_session_performance(df: pd.DataFrame, trials: pd.DataFrame) -> None:
     )
 
     verid = trials[trials["condition"] == "slow_steady"]
-    grand_means = verid.groupby("block_trial")["raw_mae"].mean()
-    grand_sems = verid.groupby("block_trial")["raw_mae"].sem()
+    grand = verid.groupby("block_trial")["raw_mae"].agg(["mean", "sem"])
+    grand_means, grand_sems = grand["mean"], grand["sem"]
 
-    for i, s in enumerate(sessions):
-        ss = verid[verid["session"] == s]
-        ax.plot(
-            ss["block_trial"],
-            ss["raw_mae"],
-            "o-",
-            color=SESSION_COLORS[i],
-            linewidth=1,
-            markersize=5,
-            alpha=0.5,
-            label=f"S{s}",
-        )
+    session_handles = _plot_session_curves(ax, verid, "raw_mae", sessions)
 
     ax.fill_between(
         grand_means.index,
@@ -442,7 +570,7 @@ def plot_session_performance(df: pd.DataFrame, trials: pd.DataFrame) -> None:
         color=COLOR_SLOW,
         alpha=0.2,
     )
-    ax.plot(
+    (mean_line,) = ax.plot(
         grand_means.index,
         grand_means,
         "o-",
@@ -454,7 +582,14 @@ def plot_session_performance(df: pd.DataFrame, trials: pd.DataFrame) -> None:
     )
 
     ax.set_xticks(range(1, 7))
-    ax.legend(fontsize=8, facecolor=PANEL_BG, edgecolor=SPINE_COLOR, labelcolor=TEXT_COLOR, ncol=3)
+    ax.legend(
+        handles=[*session_handles, mean_line],
+        fontsize=8,
+        facecolor=PANEL_BG,
+        edgecolor=SPINE_COLOR,
+        labelcolor=TEXT_COLOR,
+        ncol=3,
+    )
 
     # -- Bottom-right: Perturbed within-block --
     ax = axes[1, 1]
@@ -466,21 +601,10 @@ def plot_session_performance(df: pd.DataFrame, trials: pd.DataFrame) -> None:
     )
 
     pert = trials[trials["condition"] == "perturbed_slow"]
-    grand_means = pert.groupby("block_trial")["comp_mae"].mean()
-    grand_sems = pert.groupby("block_trial")["comp_mae"].sem()
+    grand = pert.groupby("block_trial")["comp_mae"].agg(["mean", "sem"])
+    grand_means, grand_sems = grand["mean"], grand["sem"]
 
-    for i, s in enumerate(sessions):
-        ss = pert[pert["session"] == s]
-        ax.plot(
-            ss["block_trial"],
-            ss["comp_mae"],
-            "o-",
-            color=SESSION_COLORS[i],
-            linewidth=1,
-            markersize=5,
-            alpha=0.5,
-            label=f"S{s}",
-        )
+    session_handles = _plot_session_curves(ax, pert, "comp_mae", sessions)
 
     ax.fill_between(
         grand_means.index,
@@ -489,7 +613,7 @@ def plot_session_performance(df: pd.DataFrame, trials: pd.DataFrame) -> None:
         color=COLOR_PERT,
         alpha=0.2,
     )
-    ax.plot(
+    (mean_line,) = ax.plot(
         grand_means.index,
         grand_means,
         "o-",
@@ -501,7 +625,14 @@ def plot_session_performance(df: pd.DataFrame, trials: pd.DataFrame) -> None:
     )
 
     ax.set_xticks(range(1, 7))
-    ax.legend(fontsize=8, facecolor=PANEL_BG, edgecolor=SPINE_COLOR, labelcolor=TEXT_COLOR, ncol=3)
+    ax.legend(
+        handles=[*session_handles, mean_line],
+        fontsize=8,
+        facecolor=PANEL_BG,
+        edgecolor=SPINE_COLOR,
+        labelcolor=TEXT_COLOR,
+        ncol=3,
+    )
 
     fig.suptitle(
         "Figure 2: Session Performance and Within-Block Adaptation",
@@ -523,29 +654,42 @@ def _spearman_brown(r):
     return 2 * r / (1 + abs(r))
 
 
+def _hollow_marker_handle(marker, edgecolor, label):
+    """Lightweight legend proxy matching the unfilled s=60 scatter markers."""
+    from matplotlib.lines import Line2D
+
+    return Line2D(
+        [],
+        [],
+        linestyle="none",
+        marker=marker,
+        markersize=np.sqrt(60),
+        markerfacecolor="none",
+        markeredgecolor=edgecolor,
+        markeredgewidth=1.5,
+        label=label,
+    )
+
+
+@_themed
 def plot_reliability(trials: pd.DataFrame) -> None:
     """Single split-half scatter for visual MAE across both conditions."""
+    plt = _pyplot()
     fig, ax = plt.subplots(1, 1, figsize=(6, 5.5))
-    fig.patch.set_facecolor(BG_COLOR)
 
     sessions = sorted(trials["session"].unique())
 
-    # Build split-half pairs
-    pairs = []
-    for (sess, cond), block in trials.groupby(["session", "condition"]):
-        block = block.sort_values("block_trial")
-        odd = block[block["block_trial"].isin([1, 3, 5])].reset_index(drop=True)
-        even = block[block["block_trial"].isin([2, 4, 6])].reset_index(drop=True)
-        for i in range(min(len(odd), len(even))):
-            pairs.append(
-                {
-                    "session": sess,
-                    "condition": cond,
-                    "odd": odd.iloc[i]["comp_mae"],
-                    "even": even.iloc[i]["comp_mae"],
-                }
-            )
-    sh = pd.DataFrame(pairs)
+    # Build split-half pairs: block trials (1, 2), (3, 4), (5, 6)
+    t = trials[trials["block_trial"] <= 6]
+    t = t.assign(
+        half=np.where(t["block_trial"] % 2 == 1, "odd", "even"),
+        pair_id=(t["block_trial"] - 1) // 2,
+    )
+    sh = (
+        t.pivot(index=["session", "condition", "pair_id"], columns="half", values="comp_mae")
+        .dropna(subset=["odd", "even"])
+        .reset_index()
+    )
 
     style_ax(
         ax,
@@ -574,33 +718,10 @@ def plot_reliability(trials: pd.DataFrame) -> None:
             )
 
     # Legend
-    legend_handles = []
-    for cond, marker in cond_markers.items():
-        legend_handles.append(
-            ax.scatter(
-                [],
-                [],
-                facecolors="none",
-                edgecolors=TICK_COLOR,
-                s=60,
-                linewidths=1.5,
-                marker=marker,
-                label=COND_LABELS[cond],
-            )
-        )
-    for s_idx, s in enumerate(sessions):
-        legend_handles.append(
-            ax.scatter(
-                [],
-                [],
-                facecolors="none",
-                edgecolors=SESSION_COLORS[s_idx],
-                s=60,
-                linewidths=1.5,
-                marker="o",
-                label=f"S{s}",
-            )
-        )
+    legend_handles = [
+        _hollow_marker_handle(marker, TICK_COLOR, COND_LABELS[cond])
+        for cond, marker in cond_markers.items()
+    ] + [_hollow_marker_handle("o", SESSION_COLORS[i], f"S{s}") for i, s in enumerate(sessions)]
 
     all_vals = pd.concat([sh["odd"], sh["even"]])
     lim = (0, all_vals.max() * 1.15)
@@ -646,16 +767,21 @@ def plot_reliability(trials: pd.DataFrame) -> None:
 # ======================================================================
 
 
-def plot_qc_session(csv_path: str) -> None:
-    """Generate the 6-panel QC summary for a single session using respyra."""
-    # Import the QC plotting module
+@functools.cache
+def _load_qc():
+    """Load respyra's QC plotting module from the source tree, once."""
     import importlib.util
 
     qc_module_path = Path(__file__).parent.parent / "respyra" / "utils" / "vis" / "plot_session.py"
     spec = importlib.util.spec_from_file_location("plot_session_qc", qc_module_path)
     qc = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(qc)
+    return qc
+
 
+def plot_qc_session(csv_path: str) -> None:
+    """Generate the 6-panel QC summary for a single session using respyra."""
+    qc = _load_qc()
     session_df = qc.load_session(csv_path)
     fig = qc.plot_session(session_df, csv_path)
     fig.suptitle(
@@ -696,16 +822,27 @@ def main():
     generate_table1(session_stats)
 
     print("\n=== Figures ===")
-    plot_example_trials(df, trials)
-    plot_session_performance(df, trials)
-    plot_reliability(trials)
-
-    # Figure 4: QC summary for session 1
-    ses1_path = sorted(p for p in paths if "ses-001" in p)
-    if ses1_path:
-        plot_qc_session(ses1_path[0])
-    else:
-        print("  Warning: session 1 CSV not found, skipping fig4")
+    # Figures share no state, so each is drawn and saved in its own worker
+    # process (pyplot itself is not thread-safe).  Workers are reused, so
+    # nothing a figure sets may outlive it: the paper theme is scoped with
+    # rc_context (see _themed) and Figure 4 always renders unthemed.
+    with ProcessPoolExecutor(max_workers=min(4, os.cpu_count() or 1)) as ex:
+        futures = [
+            # Workers only receive the rows and columns they draw
+            ex.submit(plot_example_trials, example_trial_rows(df), trials),
+            ex.submit(plot_session_performance, trials),
+            ex.submit(plot_reliability, trials),
+        ]
+
+        # Figure 4: QC summary for session 1
+        ses1_path = sorted(p for p in paths if "ses-001" in p)
+        if ses1_path:
+            futures.append(ex.submit(plot_qc_session, ses1_path[0]))
+        else:
+            print("  Warning: session 1 CSV not found, skipping fig4")
+
+        for future in futures:
+            future.result()
 
     print("\nDone. All outputs in paper/")
 
@@ -12,7 +12,11 @@ Generates:
 
 from __future__ import annotations
 
+import os
+import re
 import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
 import matplotlib
@@ -21,6 +25,19 @@ import numpy as np
 import pandas as pd
 
 matplotlib.use("Agg")
+# Coarser path simplification and chunked Agg paths; no visible change at 150 dpi.
+matplotlib.style.use("fast")
+
+# Per-condition plot style: (condition, color, marker, legend label).  The
+# cross-session figure uses the shorter "perturbed" label.
+_COND_STYLE = (
+    ("slow_steady", "#2196F3", "o", "slow_steady"),
+    ("perturbed_slow", "#E91E63", "s", "perturbed (2x)"),
+)
+_COND_STYLE_SHORT = (
+    ("slow_steady", "#2196F3", "o", "slow_steady"),
+    ("perturbed_slow", "#E91E63", "s", "perturbed"),
+)
 
 
 # ------------------------------------------------------------------
@@ -28,56 +45,132 @@ matplotlib.use("Agg")
 # ------------------------------------------------------------------
 
 
+# Known numeric CSV columns, typed at parse time
+CSV_DTYPES = {
+    "timestamp": "float64",
+    "force_n": "float32",
+    "target_force": "float32",
+    "error": "float32",
+    "compensated_error": "float32",
+    "trial_num": "Int16",
+    "feedback_gain": "float32",
+}
+
+# Session number in BIDS-style file names (sub-X_ses-NNN_...)
+_SES_RE = re.compile(r"ses-(\d+)")
+
+
+def _read_one(path: str, order_index: int) -> tuple[int, pd.DataFrame]:
+    """Parse one session CSV and tag it with its session number."""
+    try:
+        df = pd.read_csv(path, engine="pyarrow", dtype=CSV_DTYPES)
+    except ImportError:
+        df = pd.read_csv(path, dtype=CSV_DTYPES)
+    m = _SES_RE.search(Path(path).stem)
+    ses_num = int(m.group(1)) if m else order_index + 1
+    df["session"] = ses_num
+    return ses_num, df
+
+
 def load_sessions(paths: list[str]) -> pd.DataFrame:
-    """Load and concatenate session CSVs, adding session column."""
-    frames = []
-    for p in sorted(paths):
-        df = pd.read_csv(p)
-        # Extract session number from filename (sub-X_ses-NNN_...)
-        stem = Path(p).stem
-        ses_part = [x for x in stem.split("_") if x.startswith("ses-")]
-        ses_num = int(ses_part[0].replace("ses-", "")) if ses_part else len(frames) + 1
-        df["session"] = ses_num
-        frames.append(df)
+    """Load and concatenate session CSVs, adding session column.
+
+    Files are read in a thread pool; the CSV parser releases the GIL.
+    ``phase`` is returned as a categorical.
+    """
+    paths = sorted(paths)
+    with ThreadPoolExecutor(max_workers=max(1, min(len(paths), os.cpu_count() or 1))) as ex:
+        loaded = list(ex.map(_read_one, paths, range(len(paths))))
+    for p, (ses_num, df) in zip(paths, loaded, strict=True):
         print(f"  Loaded {p} (session {ses_num}, {len(df)} rows)")
-    return pd.concat(frames, ignore_index=True)
+    df = pd.concat([df for _, df in loaded], ignore_index=True)
+    # A handful of phase labels repeated on every sample: store as codes so
+    # phase filters compare integers rather than strings.
+    df["phase"] = df["phase"].astype("category")
+    return df
 
 
 def compute_trial_stats(df: pd.DataFrame) -> pd.DataFrame:
     """Compute per-trial MAE from tracking phase data."""
     tracking = df[df["phase"] == "tracking"]
+    tracking = tracking.assign(
+        abs_error=tracking["error"].abs(),
+        abs_comp_error=tracking["compensated_error"].abs(),
+    )
     trials = (
         tracking.groupby(["session", "trial_num", "condition", "feedback_gain"])
         .agg(
-            raw_mae=("error", lambda x: x.abs().mean()),
-            comp_mae=("compensated_error", lambda x: x.abs().mean()),
+            raw_mae=("abs_error", "mean"),
+            comp_mae=("abs_comp_error", "mean"),
             n_samples=("error", "count"),
         )
         .reset_index()
     )
     # Add within-block trial index (1-N within each condition per session)
-    for sess in trials["session"].unique():
-        for cond in trials["condition"].unique():
-            mask = (trials["session"] == sess) & (trials["condition"] == cond)
-            trials.loc[mask, "block_trial"] = range(1, mask.sum() + 1)
+    trials["block_trial"] = (
+        trials.sort_values(["session", "condition", "trial_num"])
+        .groupby(["session", "condition"])
+        .cumcount()
+        + 1
+    )
+    # Two-level label used in every per-condition lookup; store as codes.
+    trials["condition"] = trials["condition"].astype("category")
     return trials
 
 
+def by_condition(frame: pd.DataFrame) -> defaultdict[str, pd.DataFrame]:
+    """Map each condition to its rows of *frame*; absent conditions map to an empty frame."""
+    empty = frame.iloc[:0]
+    groups = defaultdict(lambda: empty)
+    groups.update(list(frame.groupby("condition", observed=True, sort=False)))
+    return groups
+
+
+def group_blocks(trials: pd.DataFrame) -> dict[tuple[int, str], pd.DataFrame]:
+    """Split *trials* into per-(session, condition) blocks."""
+    return dict(list(trials.groupby(["session", "condition"], observed=True, sort=False)))
+
+
+def save_fig(fig, output: str) -> None:
+    """Save *fig* as PNG and close it.
+
+    The constrained layout engine already fits everything on the canvas, so
+    ``bbox_inches="tight"`` (which renders the figure a second time) is
+    skipped, and zlib runs at its fastest level since these are working
+    plots, not paper figures.
+    """
+    fig.savefig(output, dpi=150, pil_kwargs={"compress_level": 1})
+    print(f"  Saved: {output}")
+    plt.close(fig)
+
+
 # ------------------------------------------------------------------
 # Plot 1: Within-block adaptation
 # ------------------------------------------------------------------
 
 
-def plot_within_block(trials: pd.DataFrame, output: str) -> None:
-    """Per-session within-block learning curves (raw + compensated)."""
-    sessions = sorted(trials["session"].unique())
+def plot_within_block(
+    trials: pd.DataFrame,
+    output: str,
+    sessions: list[int] | None = None,
+) -> None:
+    """Per-session within-block learning curves (raw + compensated).
+
+    *sessions* is the sorted list of session numbers; computed if omitted.
+    """
+    groups = group_blocks(trials)
+    if sessions is None:
+        sessions = sorted(trials["session"].unique())
+    empty = trials.iloc[:0]
     n_sess = len(sessions)
 
-    fig, axes = plt.subplots(n_sess, 2, figsize=(13, 5 * n_sess), sharey="row", squeeze=False)
+    fig, axes = plt.subplots(
+        n_sess, 2, figsize=(13, 5 * n_sess), sharey="row", squeeze=False, layout="constrained"
+    )
 
     for row, sess in enumerate(sessions):
-        st = trials[(trials["session"] == sess) & (trials["condition"] == "slow_steady")]
-        pt = trials[(trials["session"] == sess) & (trials["condition"] == "perturbed_slow")]
+        st = groups.get((sess, "slow_steady"), empty)
+        pt = groups.get((sess, "perturbed_slow"), empty)
         n_trials = max(len(st), len(pt))
 
         for col, (metric, title_suffix) in enumerate(
@@ -116,10 +209,7 @@ def plot_within_block(trials: pd.DataFrame, output: str) -> None:
         ax.set_xlabel("Trial within block", fontsize=11)
 
     fig.suptitle("Within-Block Adaptation", fontsize=14, fontweight="bold")
-    fig.tight_layout()
-    fig.savefig(output, dpi=150, bbox_inches="tight")
-    print(f"  Saved: {output}")
-    plt.close(fig)
+    save_fig(fig, output)
 
 
 # ------------------------------------------------------------------
@@ -127,31 +217,44 @@ def plot_within_block(trials: pd.DataFrame, output: str) -> None:
 # ------------------------------------------------------------------
 
 
-def plot_cross_session(trials: pd.DataFrame, output: str) -> None:
-    """Cross-session savings, asymptotic performance, and full timeline."""
-    sessions = sorted(trials["session"].unique())
+def _session_condition_mae(subset: pd.DataFrame, sessions: list[int]) -> pd.DataFrame:
+    """Pivot *subset* to a session x condition table of ``comp_mae``.
+
+    Missing session/condition cells are filled with 0 so bars line up.
+    """
+    table = subset.pivot_table(
+        index="session",
+        columns="condition",
+        values="comp_mae",
+        aggfunc="first",
+        observed=True,
+    )
+    return table.reindex(
+        index=sessions, columns=["slow_steady", "perturbed_slow"], fill_value=0
+    ).fillna(0)
+
+
+def plot_cross_session(
+    trials: pd.DataFrame, output: str, sessions: list[int] | None = None
+) -> None:
+    """Cross-session savings, asymptotic performance, and full timeline.
+
+    *sessions* is the sorted list of session numbers; computed if omitted.
+    """
+    if sessions is None:
+        sessions = sorted(trials["session"].unique())
     n_sess = len(sessions)
     max_block = int(trials["block_trial"].max())
 
-    fig, axes = plt.subplots(1, 3, figsize=(16, 5))
+    fig, axes = plt.subplots(1, 3, figsize=(16, 5), layout="constrained")
 
     # Panel A: First trial of each block across sessions
     ax = axes[0]
-    first = trials[trials["block_trial"] == 1]
+    first_mae = _session_condition_mae(trials[trials["block_trial"] == 1], sessions)
     x = np.arange(n_sess)
     w = 0.35
-    for i, (cond, color, label) in enumerate(
-        [
-            ("slow_steady", "#2196F3", "slow_steady"),
-            ("perturbed_slow", "#E91E63", "perturbed"),
-        ]
-    ):
-        vals = [
-            first[(first["session"] == s) & (first["condition"] == cond)]["comp_mae"].values
-            for s in sessions
-        ]
-        vals = [v[0] if len(v) > 0 else 0 for v in vals]
-        ax.bar(x + i * w - w / 2, vals, width=w, color=color, label=label)
+    for i, (cond, color, _, label) in enumerate(_COND_STYLE_SHORT):
+        ax.bar(x + i * w - w / 2, first_mae[cond].values, width=w, color=color, label=label)
     ax.set_xticks(x)
     ax.set_xticklabels([f"Session {s}" for s in sessions])
     ax.set_ylabel("Compensated MAE (N)", fontsize=11)
@@ -161,19 +264,9 @@ def plot_cross_session(trials: pd.DataFrame, output: str) -> None:
 
     # Panel B: Last trial of each block across sessions
     ax = axes[1]
-    last = trials[trials["block_trial"] == max_block]
-    for i, (cond, color, label) in enumerate(
-        [
-            ("slow_steady", "#2196F3", "slow_steady"),
-            ("perturbed_slow", "#E91E63", "perturbed"),
-        ]
-    ):
-        vals = [
-            last[(last["session"] == s) & (last["condition"] == cond)]["comp_mae"].values
-            for s in sessions
-        ]
-        vals = [v[0] if len(v) > 0 else 0 for v in vals]
-        ax.bar(x + i * w - w / 2, vals, width=w, color=color, label=label)
+    last_mae = _session_condition_mae(trials[trials["block_trial"] == max_block], sessions)
+    for i, (cond, color, _, label) in enumerate(_COND_STYLE_SHORT):
+        ax.bar(x + i * w - w / 2, last_mae[cond].values, width=w, color=color, label=label)
     ax.set_xticks(x)
     ax.set_xticklabels([f"Session {s}" for s in sessions])
     ax.set_ylabel("Compensated MAE (N)", fontsize=11)
@@ -185,12 +278,10 @@ def plot_cross_session(trials: pd.DataFrame, output: str) -> None:
     ax = axes[2]
     all_trials = trials.sort_values(["session", "trial_num"]).reset_index(drop=True)
     all_trials["global_trial"] = range(1, len(all_trials) + 1)
+    trials_by_cond = by_condition(all_trials)
 
-    for cond, color, marker, label in [
-        ("slow_steady", "#2196F3", "o", "slow_steady"),
-        ("perturbed_slow", "#E91E63", "s", "perturbed"),
-    ]:
-        sub = all_trials[all_trials["condition"] == cond]
+    for cond, color, marker, label in _COND_STYLE_SHORT:
+        sub = trials_by_cond[cond]
         ax.plot(
             sub["global_trial"],
             sub["comp_mae"],
@@ -213,10 +304,7 @@ def plot_cross_session(trials: pd.DataFrame, output: str) -> None:
     ax.grid(alpha=0.3)
 
     fig.suptitle("Cross-Session Motor Adaptation", fontsize=14, fontweight="bold")
-    fig.tight_layout()
-    fig.savefig(output, dpi=150, bbox_inches="tight")
-    print(f"  Saved: {output}")
-    plt.close(fig)
+    save_fig(fig, output)
 
 
 # ------------------------------------------------------------------
@@ -224,6 +312,31 @@ def plot_cross_session(trials: pd.DataFrame, output: str) -> None:
 # ------------------------------------------------------------------
 
 
+def _split_half_frame(trials: pd.DataFrame, first_trial: int, last_trial: int = 6) -> pd.DataFrame:
+    """Pair consecutive block trials from *first_trial* to *last_trial*.
+
+    Trial ``first_trial`` is paired with ``first_trial + 1``, and so on.
+    Returns one row per pair with ``session``, ``condition`` and the
+    ``raw_odd``/``raw_even``/``comp_odd``/``comp_even`` MAEs.
+    """
+    t = trials[trials["block_trial"].between(first_trial, last_trial)]
+    offset = t["block_trial"] - first_trial
+    t = t.assign(half=np.where(offset % 2 == 0, "odd", "even"), pair_idx=offset // 2)
+    wide = t.pivot(
+        index=["session", "condition", "pair_idx"],
+        columns="half",
+        values=["raw_mae", "comp_mae"],
+    )
+    sh = pd.DataFrame(
+        {
+            f"{metric.removesuffix('_mae')}_{half}": wide[(metric, half)]
+            for metric in ("raw_mae", "comp_mae")
+            for half in ("odd", "even")
+        }
+    )
+    return sh.dropna().reset_index().drop(columns="pair_idx")
+
+
 def plot_split_half(trials: pd.DataFrame, output: str) -> None:
     """Split-half reliability: pair odd trials (1,3,5) with even trials (2,4,6).
 
@@ -236,36 +349,20 @@ def plot_split_half(trials: pd.DataFrame, output: str) -> None:
     def spearman_brown(r):
         return 2 * r / (1 + abs(r))
 
-    pairs = []
-    for (sess, cond), block in trials.groupby(["session", "condition"]):
-        block = block.sort_values("block_trial")
-        odd = block[block["block_trial"].isin([1, 3, 5])].reset_index(drop=True)
-        even = block[block["block_trial"].isin([2, 4, 6])].reset_index(drop=True)
-        for i in range(min(len(odd), len(even))):
-            pairs.append(
-                {
-                    "session": sess,
-                    "condition": cond,
-                    "raw_odd": odd.iloc[i]["raw_mae"],
-                    "raw_even": even.iloc[i]["raw_mae"],
-                    "comp_odd": odd.iloc[i]["comp_mae"],
-                    "comp_even": even.iloc[i]["comp_mae"],
-                }
-            )
-
-    sh = pd.DataFrame(pairs)
+    sh = _split_half_frame(trials, first_trial=1)
+    sh_by_cond = by_condition(sh)
+    # sh is NaN-free (pairs are dropped when a half is missing), so plain
+    # NumPy reductions match the pandas ones.
+    arr = {c: sh[c].to_numpy() for c in ("raw_odd", "raw_even", "comp_odd", "comp_even")}
 
-    fig, axes = plt.subplots(1, 2, figsize=(12, 5))
+    fig, axes = plt.subplots(1, 2, figsize=(12, 5), layout="constrained")
 
     for ax, odd_col, even_col, title in [
         (axes[0], "raw_odd", "raw_even", "Raw Error"),
         (axes[1], "comp_odd", "comp_even", "Compensated Error"),
     ]:
-        for cond, color, marker, label in [
-            ("slow_steady", "#2196F3", "o", "slow_steady"),
-            ("perturbed_slow", "#E91E63", "s", "perturbed (2x)"),
-        ]:
-            sub = sh[sh["condition"] == cond]
+        for cond, color, marker, label in _COND_STYLE:
+            sub = sh_by_cond[cond]
             ax.scatter(
                 sub[odd_col],
                 sub[even_col],
@@ -276,15 +373,14 @@ def plot_split_half(trials: pd.DataFrame, output: str) -> None:
                 zorder=3,
             )
 
-        all_vals = pd.concat([sh[odd_col], sh[even_col]])
-        lim = (0, all_vals.max() * 1.15)
+        lim = (0, max(arr[odd_col].max(), arr[even_col].max()) * 1.15)
         ax.plot(lim, lim, "k--", alpha=0.3, label="identity")
         ax.set_xlim(lim)
         ax.set_ylim(lim)
         ax.set_xlabel("Odd-trial MAE (N)", fontsize=11)
         ax.set_ylabel("Even-trial MAE (N)", fontsize=11)
 
-        r = sh[odd_col].corr(sh[even_col])
+        r = np.corrcoef(arr[odd_col], arr[even_col])[0, 1]
         sb = spearman_brown(r)
         ax.set_title(f"{title}\nr = {r:.3f}, Spearman-Brown = {sb:.3f}", fontsize=12)
         ax.legend(fontsize=9)
@@ -296,10 +392,7 @@ def plot_split_half(trials: pd.DataFrame, output: str) -> None:
         fontsize=14,
         fontweight="bold",
     )
-    fig.tight_layout()
-    fig.savefig(output, dpi=150, bbox_inches="tight")
-    print(f"  Saved: {output}")
-    plt.close(fig)
+    save_fig(fig, output)
 
 
 # ------------------------------------------------------------------
@@ -319,38 +412,20 @@ def plot_asymptotic_split_half(trials: pd.DataFrame, output: str) -> None:
         return 2 * r / (1 + abs(r))
 
     # Keep only trials 3-6 (asymptotic phase)
-    asymp = trials[trials["block_trial"] >= 3].copy()
-
-    pairs = []
-    for (sess, cond), block in asymp.groupby(["session", "condition"]):
-        block = block.sort_values("block_trial")
-        odd = block[block["block_trial"].isin([3, 5])].reset_index(drop=True)
-        even = block[block["block_trial"].isin([4, 6])].reset_index(drop=True)
-        for i in range(min(len(odd), len(even))):
-            pairs.append(
-                {
-                    "session": sess,
-                    "condition": cond,
-                    "raw_odd": odd.iloc[i]["raw_mae"],
-                    "raw_even": even.iloc[i]["raw_mae"],
-                    "comp_odd": odd.iloc[i]["comp_mae"],
-                    "comp_even": even.iloc[i]["comp_mae"],
-                }
-            )
-
-    sh = pd.DataFrame(pairs)
+    sh = _split_half_frame(trials, first_trial=3)
+    sh_by_cond = by_condition(sh)
+    # sh is NaN-free (pairs are dropped when a half is missing), so plain
+    # NumPy reductions match the pandas ones.
+    arr = {c: sh[c].to_numpy() for c in ("raw_odd", "raw_even", "comp_odd", "comp_even")}
 
-    fig, axes = plt.subplots(1, 2, figsize=(12, 5))
+    fig, axes = plt.subplots(1, 2, figsize=(12, 5), layout="constrained")
 
     for ax, odd_col, even_col, title in [
         (axes[0], "raw_odd", "raw_even", "Raw Error"),
         (axes[1], "comp_odd", "comp_even", "Compensated Error"),
     ]:
-        for cond, color, marker, label in [
-            ("slow_steady", "#2196F3", "o", "slow_steady"),
-            ("perturbed_slow", "#E91E63", "s", "perturbed (2x)"),
-        ]:
-            sub = sh[sh["condition"] == cond]
+        for cond, color, marker, label in _COND_STYLE:
+            sub = sh_by_cond[cond]
             ax.scatter(
                 sub[odd_col],
                 sub[even_col],
@@ -361,15 +436,14 @@ def plot_asymptotic_split_half(trials: pd.DataFrame, output: str) -> None:
                 zorder=3,
             )
 
-        all_vals = pd.concat([sh[odd_col], sh[even_col]])
-        lim = (0, all_vals.max() * 1.15)
+        lim = (0, max(arr[odd_col].max(), arr[even_col].max()) * 1.15)
         ax.plot(lim, lim, "k--", alpha=0.3, label="identity")
         ax.set_xlim(lim)
         ax.set_ylim(lim)
         ax.set_xlabel("Odd-trial MAE (N)", fontsize=11)
         ax.set_ylabel("Even-trial MAE (N)", fontsize=11)
 
-        r = sh[odd_col].corr(sh[even_col])
+        r = np.corrcoef(arr[odd_col], arr[even_col])[0, 1]
         sb = spearman_brown(r)
         ax.set_title(f"{title}\nr = {r:.3f}, Spearman-Brown = {sb:.3f}", fontsize=12)
         ax.legend(fontsize=9)
@@ -381,10 +455,7 @@ def plot_asymptotic_split_half(trials: pd.DataFrame, output: str) -> None:
         fontsize=14,
         fontweight="bold",
     )
-    fig.tight_layout()
-    fig.savefig(output, dpi=150, bbox_inches="tight")
-    print(f"  Saved: {output}")
-    plt.close(fig)
+    save_fig(fig, output)
 
 
 # ------------------------------------------------------------------
@@ -392,46 +463,41 @@ def plot_asymptotic_split_half(trials: pd.DataFrame, output: str) -> None:
 # ------------------------------------------------------------------
 
 
-def plot_adaptation_retest(trials: pd.DataFrame, output: str) -> None:
+def plot_adaptation_retest(
+    trials: pd.DataFrame, output: str, sessions: list[int] | None = None
+) -> None:
     """Test-retest reliability of the adaptation effect across sessions.
 
     Adaptation effect = first trial MAE - last trial MAE within each block.
     Plotted per condition across sessions. With enough sessions this shows
-    whether the learning signal is stable.
+    whether the learning signal is stable.  *sessions* is the sorted list
+    of session numbers; computed if omitted.
     """
-    sessions = sorted(trials["session"].unique())
+    if sessions is None:
+        sessions = sorted(trials["session"].unique())
 
     # Compute adaptation effect per session × condition
-    effects = []
-    for (sess, cond), block in trials.groupby(["session", "condition"]):
-        block = block.sort_values("block_trial")
-        first = block[block["block_trial"] == 1].iloc[0]
-        last = block[block["block_trial"] == block["block_trial"].max()].iloc[0]
-        effects.append(
-            {
-                "session": sess,
-                "condition": cond,
-                "raw_first": first["raw_mae"],
-                "raw_last": last["raw_mae"],
-                "raw_adapt": first["raw_mae"] - last["raw_mae"],
-                "comp_first": first["comp_mae"],
-                "comp_last": last["comp_mae"],
-                "comp_adapt": first["comp_mae"] - last["comp_mae"],
-                "comp_block_mean": block["comp_mae"].mean(),
-            }
+    eff = (
+        trials.sort_values(["session", "condition", "block_trial"], kind="stable")
+        .groupby(["session", "condition"], as_index=False, observed=True, sort=True)
+        .agg(
+            raw_first=("raw_mae", "first"),
+            raw_last=("raw_mae", "last"),
+            comp_first=("comp_mae", "first"),
+            comp_last=("comp_mae", "last"),
+            comp_block_mean=("comp_mae", "mean"),
         )
+    )
+    eff["raw_adapt"] = eff["raw_first"] - eff["raw_last"]
+    eff["comp_adapt"] = eff["comp_first"] - eff["comp_last"]
+    eff_by_cond = by_condition(eff)
 
-    eff = pd.DataFrame(effects)
-
-    fig, axes = plt.subplots(1, 3, figsize=(16, 5))
+    fig, axes = plt.subplots(1, 3, figsize=(16, 5), layout="constrained")
 
     # Panel A: Block mean MAE across sessions (test-retest of level)
     ax = axes[0]
-    for cond, color, marker, label in [
-        ("slow_steady", "#2196F3", "o", "slow_steady"),
-        ("perturbed_slow", "#E91E63", "s", "perturbed (2x)"),
-    ]:
-        sub = eff[eff["condition"] == cond].sort_values("session")
+    for cond, color, marker, label in _COND_STYLE:
+        sub = eff_by_cond[cond]
         ax.plot(
             sub["session"],
             sub["comp_block_mean"],
@@ -450,11 +516,8 @@ def plot_adaptation_retest(trials: pd.DataFrame, output: str) -> None:
 
     # Panel B: Adaptation magnitude across sessions
     ax = axes[1]
-    for cond, color, marker, label in [
-        ("slow_steady", "#2196F3", "o", "slow_steady"),
-        ("perturbed_slow", "#E91E63", "s", "perturbed (2x)"),
-    ]:
-        sub = eff[eff["condition"] == cond].sort_values("session")
+    for cond, color, marker, label in _COND_STYLE:
+        sub = eff_by_cond[cond]
         ax.plot(
             sub["session"],
             sub["comp_adapt"],
@@ -474,11 +537,8 @@ def plot_adaptation_retest(trials: pd.DataFrame, output: str) -> None:
 
     # Panel C: First-trial MAE across sessions (savings)
     ax = axes[2]
-    for cond, color, marker, label in [
-        ("slow_steady", "#2196F3", "o", "slow_steady"),
-        ("perturbed_slow", "#E91E63", "s", "perturbed (2x)"),
-    ]:
-        sub = eff[eff["condition"] == cond].sort_values("session")
+    for cond, color, marker, label in _COND_STYLE:
+        sub = eff_by_cond[cond]
         ax.plot(
             sub["session"],
             sub["comp_first"],
@@ -496,16 +556,22 @@ def plot_adaptation_retest(trials: pd.DataFrame, output: str) -> None:
     ax.grid(alpha=0.3)
 
     fig.suptitle("Test-Retest: Adaptation Effect across Sessions", fontsize=14, fontweight="bold")
-    fig.tight_layout()
-    fig.savefig(output, dpi=150, bbox_inches="tight")
-    print(f"  Saved: {output}")
-    plt.close(fig)
+    save_fig(fig, output)
 
 
 # ------------------------------------------------------------------
 # Main
 # ------------------------------------------------------------------
 
+# (output file, plot function, whether it takes the shared session list)
+_PLOTS = [
+    ("adaptation_within_block.png", plot_within_block, True),
+    ("adaptation_cross_session.png", plot_cross_session, True),
+    ("split_half_reliability.png", plot_split_half, False),
+    ("asymptotic_split_half.png", plot_asymptotic_split_half, False),
+    ("adaptation_retest.png", plot_adaptation_retest, True),
+]
+
 
 def main():
     if len(sys.argv) < 2:
@@ -526,14 +592,21 @@ def main():
     df = load_sessions(paths)
     trials = compute_trial_stats(df)
 
-    print(f"\nTotal: {len(trials)} trials across {trials['session'].nunique()} sessions")
+    sessions = sorted(trials["session"].unique())
+    print(f"\nTotal: {len(trials)} trials across {len(sessions)} sessions")
     print()
 
-    plot_within_block(trials, "data/adaptation_within_block.png")
-    plot_cross_session(trials, "data/adaptation_cross_session.png")
-    plot_split_half(trials, "data/split_half_reliability.png")
-    plot_asymptotic_split_half(trials, "data/asymptotic_split_half.png")
-    plot_adaptation_retest(trials, "data/adaptation_retest.png")
+    # Each figure is independent and CPU-bound in rasterization, so render
+    # them in separate processes (pyplot state is not thread-safe).
+    with ProcessPoolExecutor(max_workers=min(len(_PLOTS), os.cpu_count() or 1)) as ex:
+        futures = [
+            ex.submit(
+                fn, trials, f"data/{name}", **({"sessions": sessions} if per_session else {})
+            )
+            for name, fn, per_session in _PLOTS
+        ]
+        for future in futures:
+            future.result()
 
     print("\nDone.")
 
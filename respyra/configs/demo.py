@@ -85,17 +85,26 @@ CONDITIONS = build_conditions(1)
 # ------------------------------------------------------------------ #
 from dataclasses import replace as _replace  # noqa: E402
 
-from respyra.configs.breath_tracking import CONFIG as _BASE  # noqa: E402
+from respyra.configs.experiment_config import ExperimentConfig as _ExperimentConfig  # noqa: E402
 from respyra.configs.experiment_config import TrialConfig as _TrialConfig  # noqa: E402
+from respyra.configs.experiment_config import lazy_config_getattr  # noqa: E402
 
-CONFIG = _replace(
-    _BASE,
-    name="Breath Tracking Demo (5 trials)",
-    timing=_replace(_BASE.timing, tracking_duration_sec=TRACKING_DURATION_SEC),
-    trial=_TrialConfig(
-        conditions=CONDITIONS,
-        n_reps=N_REPS,
-        method=TRIAL_METHOD,
-        build_conditions=build_conditions,
-    ),
-)
+
+def _build_config() -> _ExperimentConfig:
+    """Derive this config from the base breath-tracking config."""
+    from respyra.configs.breath_tracking import CONFIG as _BASE
+
+    return _replace(
+        _BASE,
+        name="Breath Tracking Demo (5 trials)",
+        timing=_replace(_BASE.timing, tracking_duration_sec=TRACKING_DURATION_SEC),
+        trial=_TrialConfig(
+            conditions=CONDITIONS,
+            n_reps=N_REPS,
+            method=TRIAL_METHOD,
+            build_conditions=build_conditions,
+        ),
+    )
+
+
+__getattr__ = lazy_config_getattr(globals(), _build_config)
@@ -12,10 +12,11 @@ import individual sub-configs to compose custom setups.
 
 from __future__ import annotations
 
+import functools
 import importlib
 import importlib.util
 import sys
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -26,17 +27,17 @@ from respyra.core.target_generator import ConditionDef
 # ------------------------------------------------------------------ #
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BeltConfig:
     """Vernier breath belt connection parameters."""
 
     connection: str = "ble"
     device_to_open: str | None = "proximity_pairing"
     period_ms: int = 100
-    channels: list[int] = field(default_factory=lambda: [1])
+    channels: tuple[int, ...] = (1,)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DisplayConfig:
     """PsychoPy window and monitor parameters."""
 
@@ -49,7 +50,7 @@ class DisplayConfig:
     bg_color: tuple[float, float, float] = (-1, -1, -1)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TraceConfig:
     """Waveform trace display parameters."""
 
@@ -60,7 +61,7 @@ class TraceConfig:
     duration_sec: float = 5.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DotConfig:
     """Target dot appearance and feedback parameters."""
 
@@ -75,7 +76,7 @@ class DotConfig:
     graded_max_error_n: float = 3.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TimingConfig:
     """Phase duration parameters (seconds)."""
 
@@ -85,7 +86,7 @@ class TimingConfig:
     tracking_duration_sec: float = 30.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RangeCalConfig:
     """Range calibration parameters."""
 
@@ -96,11 +97,11 @@ class RangeCalConfig:
     force_saturation_hi: float = 40.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TrialConfig:
     """Trial structure parameters."""
 
-    conditions: list[ConditionDef] = field(default_factory=list)
+    conditions: Sequence[ConditionDef] = ()
     n_reps: int = 1
     method: str = "sequential"
     build_conditions: Callable[[str], list[ConditionDef]] | None = None
@@ -110,7 +111,7 @@ class TrialConfig:
 #  Top-level config                                                    #
 # ------------------------------------------------------------------ #
 
-_DEFAULT_DATA_COLUMNS = [
+_DEFAULT_DATA_COLUMNS = (
     "timestamp",
     "frame",
     "force_n",
@@ -121,10 +122,10 @@ _DEFAULT_DATA_COLUMNS = [
     "condition",
     "trial_num",
     "feedback_gain",
-]
+)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExperimentConfig:
     """Complete configuration for a breath tracking experiment.
 
@@ -139,24 +140,38 @@ class ExperimentConfig:
 
         from dataclasses import replace
         cfg2 = replace(cfg, timing=replace(cfg.timing, baseline_duration_sec=15.0))
+
+    All config classes are frozen, so defaults (including the default
+    sub-configs and the tuple-valued fields) are shared between instances
+    rather than rebuilt for each one.
     """
 
     name: str = "Breath Tracking Task"
-    belt: BeltConfig = field(default_factory=BeltConfig)
-    display: DisplayConfig = field(default_factory=DisplayConfig)
-    trace: TraceConfig = field(default_factory=TraceConfig)
-    dot: DotConfig = field(default_factory=DotConfig)
-    timing: TimingConfig = field(default_factory=TimingConfig)
-    range_cal: RangeCalConfig = field(default_factory=RangeCalConfig)
-    trial: TrialConfig = field(default_factory=TrialConfig)
+    belt: BeltConfig = BeltConfig()
+    display: DisplayConfig = DisplayConfig()
+    trace: TraceConfig = TraceConfig()
+    dot: DotConfig = DotConfig()
+    timing: TimingConfig = TimingConfig()
+    range_cal: RangeCalConfig = RangeCalConfig()
+    trial: TrialConfig = TrialConfig()
     output_dir: str = "data/"
     escape_key: str = "escape"
-    data_columns: list[str] = field(default_factory=lambda: list(_DEFAULT_DATA_COLUMNS))
+    data_columns: Sequence[str] = _DEFAULT_DATA_COLUMNS
+    _trace_buffer_size: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Derived from two frozen sub-configs, so it can be fixed once here
+        # (replace() builds a new instance and re-runs this).
+        object.__setattr__(
+            self,
+            "_trace_buffer_size",
+            int(self.trace.duration_sec * (1000 / self.belt.period_ms)),
+        )
 
     @property
     def trace_buffer_size(self) -> int:
         """Number of samples visible in the trace window."""
-        return int(self.trace.duration_sec * (1000 / self.belt.period_ms))
+        return self._trace_buffer_size
 
 
 # ------------------------------------------------------------------ #
@@ -196,6 +211,14 @@ def load_config(source: str | ExperimentConfig | None = None) -> ExperimentConfi
         If the loaded module has no ``CONFIG`` attribute.
     ImportError
         If a module path cannot be imported.
+
+    Notes
+    -----
+    Loaded configs are memoized per file path (and modification time) or
+    module path, so repeated calls return the same immutable instance
+    without re-importing.  ``load_config.cache_clear()`` drops the memo:
+    file-path configs are then re-executed on the next call, while module
+    configs still come from the module already in ``sys.modules``.
     """
     if source is None:
         return ExperimentConfig()
@@ -220,7 +243,12 @@ def _load_from_file(path: str) -> ExperimentConfig:
     filepath = Path(path).resolve()
     if not filepath.exists():
         raise FileNotFoundError(f"Config file not found: {filepath}")
+    return _load_file_cached(filepath, filepath.stat().st_mtime_ns)
+
 
+@functools.lru_cache(maxsize=32)
+def _load_file_cached(filepath: Path, mtime_ns: int) -> ExperimentConfig:
+    """Import *filepath* once per modification time (*mtime_ns* is only a cache key)."""
     module_name = f"_respyra_config_{filepath.stem}"
     spec = importlib.util.spec_from_file_location(module_name, filepath)
     if spec is None or spec.loader is None:
@@ -228,7 +256,9 @@ def _load_from_file(path: str) -> ExperimentConfig:
 
     module = importlib.util.module_from_spec(spec)
 
-    # Temporarily add parent directory so sibling imports work
+    # Temporarily add parent directory so sibling imports work (skipped
+    # when it is already importable, e.g. a file under experiments/ run
+    # from that directory)
     parent = str(filepath.parent)
     added = parent not in sys.path
     if added:
@@ -236,18 +266,32 @@ def _load_from_file(path: str) -> ExperimentConfig:
     try:
         spec.loader.exec_module(module)
     finally:
-        if added and parent in sys.path:
-            sys.path.remove(parent)
+        if added:
+            # Normally still at the front: pop it without a scan
+            if sys.path and sys.path[0] == parent:
+                sys.path.pop(0)
+            elif parent in sys.path:
+                sys.path.remove(parent)
 
     return _extract_config(module, str(filepath))
 
 
+@functools.lru_cache(maxsize=32)
 def _load_from_module(module_path: str) -> ExperimentConfig:
     """Import a module by dotted path and return its CONFIG object."""
     module = importlib.import_module(module_path)
     return _extract_config(module, module_path)
 
 
+def _clear_config_cache() -> None:
+    """Drop all memoized configs (see the notes on :func:`load_config`)."""
+    _load_file_cached.cache_clear()
+    _load_from_module.cache_clear()
+
+
+load_config.cache_clear = _clear_config_cache
+
+
 def _extract_config(module: object, source_label: str) -> ExperimentConfig:
     """Extract the CONFIG attribute from a loaded module."""
     if not hasattr(module, "CONFIG"):
@@ -261,3 +305,24 @@ def _extract_config(module: object, source_label: str) -> ExperimentConfig:
             f"CONFIG in '{source_label}' is {type(cfg).__name__}, expected ExperimentConfig."
         )
     return cfg
+
+
+def lazy_config_getattr(
+    namespace: dict[str, object], build: Callable[[], ExperimentConfig]
+) -> Callable[[str], ExperimentConfig]:
+    """Return a module ``__getattr__`` (PEP 562) that builds ``CONFIG`` lazily.
+
+    Config modules bind the result as ``__getattr__ = lazy_config_getattr(
+    globals(), _build_config)`` so importing their scalar constants does not
+    instantiate the nested config dataclasses.  The built config is stored
+    in *namespace*, so *build* runs at most once.
+    """
+    module_name = namespace["__name__"]
+
+    def __getattr__(name: str) -> ExperimentConfig:
+        if name == "CONFIG":
+            config = namespace["CONFIG"] = build()
+            return config
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+    return __getattr__
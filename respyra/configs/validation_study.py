@@ -14,44 +14,6 @@ The session number entered in the participant dialog determines
 counterbalancing: odd sessions start slow_steady, even start perturbed.
 """
 
-# ------------------------------------------------------------------ #
-#  Inherit all defaults from the base config                          #
-# ------------------------------------------------------------------ #
-from respyra.configs.breath_tracking import (  # noqa: F401, E402
-    BASELINE_DURATION_SEC,
-    BELT_CHANNELS,
-    BELT_PERIOD_MS,
-    BG_COLOR,
-    CONNECTION,
-    COUNTDOWN_DURATION_SEC,
-    DATA_COLUMNS,
-    DEVICE_TO_OPEN,
-    DOT_COLOR_BAD,
-    DOT_COLOR_GOOD,
-    DOT_COLOR_MID,
-    DOT_FEEDBACK_MODE,
-    DOT_GRADED_MAX_ERROR_N,
-    DOT_RADIUS,
-    DOT_X_OFFSET,
-    ERROR_THRESHOLD_MID_N,
-    ERROR_THRESHOLD_N,
-    ESCAPE_KEY,
-    FORCE_SATURATION_HI,
-    FORCE_SATURATION_LO,
-    MONITOR_DISTANCE_CM,
-    MONITOR_NAME,
-    MONITOR_WIDTH_CM,
-    RANGE_CAL_DURATION_SEC,
-    RANGE_CAL_PERCENTILE_HI,
-    RANGE_CAL_PERCENTILE_LO,
-    RANGE_CAL_SCALE,
-    TRACE_BORDER_COLOR,
-    TRACE_BUFFER_SIZE,
-    TRACE_COLOR,
-    TRACE_RECT,
-    TRACE_Y_RANGE,
-    UNITS,
-)
 from respyra.core.target_generator import ConditionDef, SegmentDef
 
 # ------------------------------------------------------------------ #
@@ -71,6 +33,10 @@ PERTURBED_SLOW = ConditionDef("perturbed_slow", [SegmentDef(0.1, 4)], feedback_g
 # ------------------------------------------------------------------ #
 BLOCK_SIZE = 6
 
+# Only two orderings exist, so build them once and copy per call.
+_ODD_SESSION = (SLOW_STEADY,) * BLOCK_SIZE + (PERTURBED_SLOW,) * BLOCK_SIZE
+_EVEN_SESSION = (PERTURBED_SLOW,) * BLOCK_SIZE + (SLOW_STEADY,) * BLOCK_SIZE
+
 # ------------------------------------------------------------------ #
 #  Trials                                                              #
 # ------------------------------------------------------------------ #
@@ -94,10 +60,7 @@ def build_conditions(session_num: str) -> list[ConditionDef]:
     Odd sessions (1, 3): slow_steady block first.
     Even sessions (2, 4): perturbed block first.
     """
-    if int(session_num) % 2 == 1:
-        return [SLOW_STEADY] * BLOCK_SIZE + [PERTURBED_SLOW] * BLOCK_SIZE
-    else:
-        return [PERTURBED_SLOW] * BLOCK_SIZE + [SLOW_STEADY] * BLOCK_SIZE
+    return list(_ODD_SESSION if int(session_num) % 2 == 1 else _EVEN_SESSION)
 
 
 # Default CONDITIONS for backward compatibility — overridden by the
@@ -109,18 +72,43 @@ CONDITIONS = build_conditions(1)
 # ------------------------------------------------------------------ #
 from dataclasses import replace as _replace  # noqa: E402
 
-from respyra.configs.breath_tracking import CONFIG as _BASE  # noqa: E402
+from respyra.configs.experiment_config import ExperimentConfig as _ExperimentConfig  # noqa: E402
 from respyra.configs.experiment_config import TrialConfig as _TrialConfig  # noqa: E402
-
-CONFIG = _replace(
-    _BASE,
-    name="Validation Study",
-    display=_replace(_BASE.display, fullscr=FULLSCR, monitor_size_pix=MONITOR_SIZE_PIX),
-    timing=_replace(_BASE.timing, tracking_duration_sec=TRACKING_DURATION_SEC),
-    trial=_TrialConfig(
-        conditions=CONDITIONS,
-        n_reps=N_REPS,
-        method=TRIAL_METHOD,
-        build_conditions=build_conditions,
-    ),
-)
+from respyra.configs.experiment_config import lazy_config_getattr  # noqa: E402
+
+
+def _build_config() -> _ExperimentConfig:
+    """Derive this config from the base breath-tracking config."""
+    from respyra.configs.breath_tracking import CONFIG as _BASE
+
+    return _replace(
+        _BASE,
+        name="Validation Study",
+        display=_replace(_BASE.display, fullscr=FULLSCR, monitor_size_pix=MONITOR_SIZE_PIX),
+        timing=_replace(_BASE.timing, tracking_duration_sec=TRACKING_DURATION_SEC),
+        trial=_TrialConfig(
+            conditions=CONDITIONS,
+            n_reps=N_REPS,
+            method=TRIAL_METHOD,
+            build_conditions=build_conditions,
+        ),
+    )
+
+
+_config_getattr = lazy_config_getattr(globals(), _build_config)
+
+
+def __getattr__(name: str):
+    # Every other default is inherited from the base config, which is
+    # only imported once one of its constants is actually read.
+    if name.isupper() and name != "CONFIG":
+        from respyra.configs import breath_tracking
+
+        try:
+            value = getattr(breath_tracking, name)
+        except AttributeError:
+            pass
+        else:
+            globals()[name] = value
+            return value
+    return _config_getattr(name)
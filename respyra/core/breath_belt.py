@@ -45,6 +45,8 @@ import queue
 import threading
 import time
 
+import numpy as np
+
 from respyra.core.gdx import gdx as _gdx_module
 
 logger = logging.getLogger(__name__)
@@ -204,6 +206,31 @@ class BreathBelt:
             pass
         return samples
 
+    def get_all_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """Drain all queued samples into timestamp and force arrays.
+
+        Array counterpart of :meth:`get_all` for callers that process a
+        batch of samples with NumPy.
+
+        Returns
+        -------
+        timestamps : numpy.ndarray
+            Sample timestamps (float64), in chronological order.
+        forces : numpy.ndarray
+            Force values (float64) matching *timestamps*.  Both arrays
+            are empty if no new samples have arrived.
+
+        Raises
+        ------
+        BreathBeltError
+            If the reader thread has recorded an error.
+        """
+        samples = self.get_all()
+        if not samples:
+            return np.empty(0), np.empty(0)
+        timestamps, forces = np.array(samples, dtype=float).T.copy()
+        return timestamps, forces
+
     def stop(self) -> None:
         """Signal the reader thread to stop, join it, and close the device.
 
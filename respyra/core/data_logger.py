@@ -18,6 +18,7 @@ Usage
 from __future__ import annotations
 
 import csv
+import itertools
 import os
 from collections.abc import Sequence
 from datetime import datetime
@@ -123,6 +124,44 @@ class DataLogger:
         self._writer.writerow(row)
         self._file.flush()
 
+    def log_rows(self, **columns) -> None:
+        """Append several rows at once from column-wise values.
+
+        The batch counterpart of :meth:`log_row`: all rows are written in
+        one pass and flushed once.
+
+        Parameters
+        ----------
+        **columns
+            Keyword arguments whose keys match column names.  Each value
+            is either a sequence (list, tuple or NumPy array) holding one
+            entry per row, or a single value repeated on every row.  All
+            sequences must have the same length.  Unrecognised keys are
+            silently ignored; missing columns are written as empty strings.
+
+        Raises
+        ------
+        ValueError
+            If no per-row sequence is given or their lengths differ.
+        """
+        n_rows = None
+        fields = []
+        for col in self.columns:
+            value = columns.get(col, "")
+            if isinstance(value, str) or not hasattr(value, "__len__"):
+                fields.append(itertools.repeat(value))
+                continue
+            if n_rows is None:
+                n_rows = len(value)
+            elif len(value) != n_rows:
+                raise ValueError(f"Column {col!r} has {len(value)} values, expected {n_rows}.")
+            fields.append(value.tolist() if hasattr(value, "tolist") else value)
+        if n_rows is None:
+            raise ValueError("log_rows() needs at least one per-row sequence.")
+        # Broadcast columns are endless repeats; the sequences bound the zip.
+        self._writer.writerows(zip(*fields, strict=False))
+        self._file.flush()
+
     def log_sample(
         self,
         timestamp: float,
@@ -7,8 +7,41 @@ pre-created stimuli).  Also contains :class:`SignalTrace`, a pre-allocated
 and :func:`draw_signal_trace`, a convenience wrapper with automatic caching.
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
 import numpy as np
-from psychopy import event, monitors, visual
+
+if TYPE_CHECKING:
+    from psychopy import event, monitors, visual
+
+# ---------------------------------------------------------------------------
+# Lazy PsychoPy import
+# ---------------------------------------------------------------------------
+
+# Importing PsychoPy pulls in its whole stack (pyglet, GL, ...), so the
+# submodules are bound into this namespace on first use rather than at
+# import time.  ``import respyra.core.display`` alone stays cheap.
+_PSYCHOPY_MODULES = ("event", "monitors", "visual")
+
+
+def _load_psychopy() -> None:
+    """Bind ``event``, ``monitors`` and ``visual`` as module globals if missing."""
+    namespace = globals()
+    for name in _PSYCHOPY_MODULES:
+        if name not in namespace:
+            namespace[name] = importlib.import_module(f"psychopy.{name}")
+
+
+def __getattr__(name: str):
+    """Resolve ``display.visual`` etc. from outside the module (PEP 562)."""
+    if name in _PSYCHOPY_MODULES:
+        _load_psychopy()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # ---------------------------------------------------------------------------
 # Monitor profile
@@ -34,8 +67,22 @@ def create_monitor(
     Returns
     -------
     monitors.Monitor
+
+    Notes
+    -----
+    If a saved profile named *name* already has these settings it is
+    returned as loaded, skipping the write to PsychoPy's monitor store.
     """
+    _load_psychopy()
     mon = monitors.Monitor(name)
+    saved_size = mon.getSizePix()
+    if (
+        mon.getWidth() == width_cm
+        and mon.getDistance() == distance_cm
+        and saved_size is not None
+        and tuple(saved_size) == tuple(size_pix)
+    ):
+        return mon
     mon.setWidth(width_cm)
     mon.setDistance(distance_cm)
     mon.setSizePix(size_pix)
@@ -78,6 +125,7 @@ def create_window(
     -------
     visual.Window
     """
+    _load_psychopy()
     # Resolve monitor argument
     if isinstance(monitor, str):
         monitor = monitors.Monitor(monitor)
@@ -118,6 +166,7 @@ def show_text_and_wait(
     str
         The key that was pressed.
     """
+    _load_psychopy()
     if key_list is None:
         key_list = ["space"]
 
@@ -172,13 +221,16 @@ class SignalTrace:
         color="green",
         line_width=2.0,
     ):
+        _load_psychopy()
         self.win = win
         self.left, self.bottom, self.right, self.top = trace_rect
         self.y_min, self.y_max = y_range
         self.width = self.right - self.left
         self.height = self.top - self.bottom
 
-        # Pre-create ShapeStim with placeholder vertices (a flat line)
+        # Pre-create ShapeStim with placeholder vertices (a flat line).
+        # autoLog is off because vertices are reassigned every frame and
+        # PsychoPy would otherwise queue a repr() of the whole array per flip.
         placeholder = [[self.left, self.bottom], [self.right, self.bottom]]
         self._shape = visual.ShapeStim(
             win,
@@ -187,8 +239,15 @@ class SignalTrace:
             lineWidth=line_width,
             closeShape=False,
             interpolate=True,
+            autoLog=False,
         )
 
+        # Vertex buffer reused across frames; x is fixed for a given point
+        # count, so it is only refilled when the number of points changes.
+        # New y values are scaled into _ys first and compared against it.
+        self._verts = np.empty((0, 2))
+        self._ys = np.empty(0)
+
     def draw(self, data_points):
         """Update vertices from *data_points* and draw to the back buffer.
 
@@ -202,21 +261,29 @@ class SignalTrace:
         if n < 2:
             return  # need at least 2 points for a line
 
-        # Build vertices: evenly space across x, scale y into the rect
-        xs = np.linspace(self.left, self.right, n)
+        if n != len(self._verts):
+            self._verts = np.full((n, 2), np.nan)
+            self._verts[:, 0] = np.linspace(self.left, self.right, n)
+            self._ys = np.empty(n)
 
-        pts = np.asarray(data_points, dtype=float)
-        # Clamp then normalise into 0..1
+        # Scale y into the rect in place: clamp to y_range, then map to
+        # bottom..top.  y_min/y_max may be changed between frames.
+        ys = self._ys
         y_span = self.y_max - self.y_min
         if y_span == 0:
-            normed = np.full_like(pts, 0.5)
+            ys.fill(self.bottom + 0.5 * self.height)
         else:
-            normed = (pts - self.y_min) / y_span
-            normed = np.clip(normed, 0.0, 1.0)
-
-        ys = self.bottom + normed * self.height
-
-        self._shape.vertices = np.column_stack([xs, ys])
+            np.subtract(data_points, self.y_min, out=ys)
+            ys /= y_span
+            np.clip(ys, 0.0, 1.0, out=ys)
+            ys *= self.height
+            ys += self.bottom
+
+        # The belt samples slower than the display refreshes, so most frames
+        # show an unchanged trace; only hand PsychoPy vertices that moved.
+        if not np.array_equal(ys, self._verts[:, 1]):
+            self._verts[:, 1] = ys
+            self._shape.vertices = self._verts
         self._shape.draw()
 
 
@@ -228,8 +295,10 @@ def draw_signal_trace(
 ):
     """Convenience function: draw a signal trace on *win* this frame.
 
-    Internally caches a :class:`SignalTrace` per window so the ShapeStim
-    is created only once — safe to call every frame without allocations.
+    Internally caches a :class:`SignalTrace` per window, keyed on the
+    window and the visual parameters, so the ShapeStim is created only
+    once — safe to call every frame without allocations.  *y_range*,
+    *trace_rect* and *color* must therefore be hashable (e.g. tuples).
 
     Parameters
     ----------
@@ -243,14 +312,15 @@ def draw_signal_trace(
     color : str or tuple
         Line color.
     """
-    cache_key = id(win)
-    cached = _signal_trace_cache.get(cache_key)
-
-    # Recreate if the visual parameters changed
-    if cached is None or cached._y_cfg != (y_range, trace_rect, color):
+    cache_key = (id(win), y_range, trace_rect, color)
+    trace = _signal_trace_cache.get(cache_key)
+
+    # New window or changed visual parameters: replace this window's trace
+    if trace is None:
+        win_id = id(win)
+        for stale in [key for key in _signal_trace_cache if key[0] == win_id]:
+            del _signal_trace_cache[stale]
         trace = SignalTrace(win, trace_rect=trace_rect, y_range=y_range, color=color)
-        trace._y_cfg = (y_range, trace_rect, color)
         _signal_trace_cache[cache_key] = trace
-        cached = trace
 
-    cached.draw(data_points)
+    trace.draw(data_points)
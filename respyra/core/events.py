@@ -1,7 +1,8 @@
 """Response collection and event logging helpers.
 
 Thin wrappers around PsychoPy's event module that standardise the return
-format and provide a simple event-log accumulator.
+format and provide simple event-log accumulators (a list of dicts, or the
+columnar :class:`EventLog`).
 """
 
 from psychopy import event
@@ -25,8 +26,10 @@ def check_keys(key_list=None, clock=None):
         from PsychoPy's default monotonic clock.
     """
     keys = event.getKeys(keyList=key_list, timeStamped=clock or True)
+    if not keys:
+        return []  # the common per-frame case: nothing pressed
     # getKeys with timeStamped returns list of [key, time] sub-lists
-    return [(k, t) for k, t in keys]
+    return [tuple(kt) for kt in keys]
 
 
 def wait_for_key(key_list=None, clock=None, max_wait=float("inf")):
@@ -52,9 +55,9 @@ def wait_for_key(key_list=None, clock=None, max_wait=float("inf")):
         keyList=key_list,
         timeStamped=clock or True,
     )
-    if keys is None:
+    if not keys:
         return None
-    return (keys[0][0], keys[0][1])
+    return tuple(keys[0])
 
 
 def record_event(event_log, event_type, timestamp, **data):
@@ -62,8 +65,9 @@ def record_event(event_log, event_type, timestamp, **data):
 
     Parameters
     ----------
-    event_log : list
-        Mutable list that accumulates event records.
+    event_log : list or EventLog
+        Mutable list that accumulates event records, or an
+        :class:`EventLog` (recorded column-wise).
     event_type : str
         Label for this event (e.g. ``'trial_start'``, ``'response'``).
     timestamp : float
@@ -71,10 +75,63 @@ def record_event(event_log, event_type, timestamp, **data):
     **data
         Arbitrary extra fields merged into the record.
     """
-    event_log.append(
-        {
-            "event_type": event_type,
-            "timestamp": timestamp,
-            **data,
-        }
-    )
+    if isinstance(event_log, EventLog):
+        event_log.record(event_type, timestamp, **data)
+        return
+    record = {"event_type": event_type, "timestamp": timestamp}
+    if data:  # most markers carry no extra fields
+        record.update(data)
+    event_log.append(record)
+
+
+class EventLog:
+    """Columnar event accumulator.
+
+    Stores event types, timestamps and extra fields in parallel lists
+    rather than one dict per event, which keeps long sessions compact and
+    turns conversion to a table into a per-column operation::
+
+        log = EventLog()
+        log.record("trial_start", clock.getTime(), trial=1)
+        df = pandas.DataFrame(log.columns())
+
+    Iterating yields the same dicts :func:`record_event` would have
+    appended to a list, and :func:`record_event` accepts an
+    ``EventLog`` in place of a list.
+    """
+
+    __slots__ = ("event_types", "timestamps", "extras")
+
+    def __init__(self):
+        self.event_types: list[str] = []
+        self.timestamps: list[float] = []
+        self.extras: list[dict | None] = []
+
+    def record(self, event_type, timestamp, **data):
+        """Append one event; *data* holds any extra fields."""
+        self.event_types.append(event_type)
+        self.timestamps.append(timestamp)
+        self.extras.append(data or None)
+
+    def columns(self):
+        """Return ``{column: list}`` with one entry per event.
+
+        Extra fields become their own columns; events without a given
+        field get ``None`` there.
+        """
+        cols = {"event_type": self.event_types, "timestamp": self.timestamps}
+        keys = dict.fromkeys(k for extra in self.extras if extra for k in extra)
+        for key in keys:
+            cols[key] = [extra.get(key) if extra else None for extra in self.extras]
+        return cols
+
+    def __len__(self):
+        return len(self.event_types)
+
+    def __iter__(self):
+        rows = zip(self.event_types, self.timestamps, self.extras, strict=True)
+        for event_type, timestamp, extra in rows:
+            record = {"event_type": event_type, "timestamp": timestamp}
+            if extra:
+                record.update(extra)
+            yield record
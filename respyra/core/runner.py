@@ -13,14 +13,14 @@ experiment flows::
     from respyra.core.runner import (
         connect_belt, setup_display, run_participant_dialog,
         run_range_calibration, run_baseline, run_countdown,
-        run_tracking, ExperimentState,
+        run_tracking, ExperimentState, TraceBuffer,
     )
 """
 
 from __future__ import annotations
 
-import colorsys
-from collections import deque
+import functools
+import math
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -36,18 +36,65 @@ from respyra.core.target_generator import TargetGenerator, calibrate_from_baseli
 # ====================================================================
 
 
-def apply_gain(buffer, gain: float, center: float) -> list[float]:
-    """Return a perturbed copy of *buffer* for display.
+def apply_gain(buffer, gain: float, center: float, out: np.ndarray | None = None) -> np.ndarray:
+    """Return a perturbed version of *buffer* for display.
 
     Applies a multiplicative gain around *center*::
 
         perturbed = center + gain * (force - center)
 
-    When ``gain == 1.0`` returns an unmodified copy.
+    The arithmetic runs as whole-array NumPy operations.  When
+    ``gain == 1.0`` the samples are returned as an array without
+    copying if *buffer* already is one, so treat the result as
+    read-only.
+
+    Parameters
+    ----------
+    buffer : array_like
+        Force samples (e.g. :meth:`TraceBuffer.view`).
+    gain : float
+        Feedback gain.
+    center : float
+        Force value the gain is applied around.
+    out : numpy.ndarray, optional
+        Scratch array at least ``len(buffer)`` long.  The result is
+        written into its leading slice, which is returned, so no array
+        is allocated per call.
+
+    Returns
+    -------
+    numpy.ndarray
     """
+    data = np.asarray(buffer, dtype=float)
     if gain == 1.0:
-        return list(buffer)
-    return [center + gain * (f - center) for f in buffer]
+        return data
+    result = np.empty_like(data) if out is None else out[: len(data)]
+    np.subtract(data, center, out=result)
+    result *= gain
+    result += center
+    return result
+
+
+_GRADED_LUT_STEPS = 4096
+
+
+@functools.cache
+def _graded_lut() -> np.ndarray:
+    """Colours for :func:`graded_dot_color`, indexed by the curved error.
+
+    Row ``i`` holds the PsychoPy RGB colour for
+    ``sqrt(abs(error) / max_error) == i / _GRADED_LUT_STEPS``.  Built on
+    first use.
+    """
+    t = np.linspace(0.0, 1.0, _GRADED_LUT_STEPS + 1)
+    # HSV -> RGB at full saturation and value for hues 0..120 deg, i.e.
+    # the first two sextants: red -> yellow (g rises), yellow -> green
+    # (r falls); blue stays 0.
+    hue6 = (1.0 - t) * 2.0
+    rgb = np.zeros((len(t), 3))
+    np.minimum(1.0, 2.0 - hue6, out=rgb[:, 0])
+    np.minimum(1.0, hue6, out=rgb[:, 1])
+    return rgb * 2 - 1
 
 
 def graded_dot_color(error: float, max_error: float) -> tuple[float, float, float]:
@@ -57,12 +104,14 @@ def graded_dot_color(error: float, max_error: float) -> tuple[float, float, floa
     Error 0 maps to green (hue 120 deg), error >= *max_error* maps to
     red (hue 0 deg).  A square-root curve sharpens the falloff so
     small errors already shift noticeably toward yellow.
+
+    The colour is read from a precomputed table of 4097 hues, so it is
+    exact to within about ``1e-3`` per channel.
     """
     t = min(abs(error) / max_error, 1.0)
-    t = t**0.5
-    hue = (1.0 - t) / 3.0
-    r, g, b = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-    return (r * 2 - 1, g * 2 - 1, b * 2 - 1)
+    i = round(t**0.5 * _GRADED_LUT_STEPS)
+    r, g, b = _graded_lut()[i].tolist()
+    return (r, g, b)
 
 
 def _force_to_dot_y(
@@ -74,10 +123,38 @@ def _force_to_dot_y(
 ) -> float:
     """Map a force value to a screen-y position within the trace rect."""
     y_span = y_max - y_min
-    normed = 0.5 if y_span == 0 else float(np.clip((force - y_min) / y_span, 0.0, 1.0))
+    if y_span == 0:
+        normed = 0.5
+    else:
+        # Plain comparisons: np.clip on a scalar costs a ufunc dispatch
+        normed = (force - y_min) / y_span
+        normed = 0.0 if normed < 0.0 else 1.0 if normed > 1.0 else normed
     return trace_bottom + normed * (trace_top - trace_bottom)
 
 
+def _tracking_errors(
+    forces: np.ndarray,
+    target_force: float,
+    center: float,
+    gain: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Raw and gain-compensated tracking errors for a batch of samples.
+
+    The compensated error is measured against the force as displayed,
+    i.e. after :func:`apply_gain`.
+
+    Returns
+    -------
+    error : numpy.ndarray
+        ``target_force - forces``.
+    compensated_error : numpy.ndarray
+        ``target_force - (center + gain * (forces - center))``.
+    """
+    error = target_force - forces
+    compensated_error = target_force - (center + gain * (forces - center))
+    return error, compensated_error
+
+
 def _compute_dot_color(
     current_error: float,
     cfg: ExperimentConfig,
@@ -99,6 +176,80 @@ def _compute_dot_color(
             return cfg.dot.color_bad
 
 
+# ====================================================================
+# Trace buffer
+# ====================================================================
+
+
+class TraceBuffer:
+    """Fixed-length ring buffer of recent force samples for the trace.
+
+    Behaves like ``collections.deque(maxlen=maxlen)`` for the operations
+    the phases use (``append``, ``extend``, ``clear``, ``len``,
+    iteration, ``[-1]``),
+    but stores samples in a NumPy array.  Every sample is written twice,
+    at ``i`` and ``i + maxlen``, so :meth:`view` can return the buffered
+    samples oldest-first as a contiguous slice without copying.
+
+    Parameters
+    ----------
+    maxlen : int
+        Number of samples retained (e.g.
+        :attr:`ExperimentConfig.trace_buffer_size`).
+    """
+
+    def __init__(self, maxlen: int):
+        self.maxlen = maxlen
+        self._data = np.zeros(2 * maxlen)
+        self._head = 0  # next write position, in [0, maxlen)
+        self._len = 0
+
+    def append(self, value: float) -> None:
+        """Add *value*, dropping the oldest sample once full."""
+        head = self._head
+        self._data[head] = self._data[head + self.maxlen] = value
+        self._head = head + 1 if head + 1 < self.maxlen else 0
+        if self._len < self.maxlen:
+            self._len += 1
+
+    def extend(self, values) -> None:
+        """Append each of *values* in order, as repeated :meth:`append` would."""
+        values = np.asarray(values, dtype=float)
+        maxlen = self.maxlen
+        if len(values) > maxlen:
+            values = values[-maxlen:]
+        n = len(values)
+        head = self._head
+        first = min(n, maxlen - head)
+        self._data[head : head + first] = values[:first]
+        self._data[head + maxlen : head + maxlen + first] = values[:first]
+        rest = n - first
+        if rest:
+            self._data[:rest] = values[first:]
+            self._data[maxlen : maxlen + rest] = values[first:]
+        self._head = (head + n) % maxlen
+        self._len = min(self._len + n, maxlen)
+
+    def clear(self) -> None:
+        """Drop all samples (storage is kept)."""
+        self._head = 0
+        self._len = 0
+
+    def view(self) -> np.ndarray:
+        """Return the buffered samples, oldest first, as a view (do not modify)."""
+        end = self._head + self.maxlen if self._len == self.maxlen else self._head
+        return self._data[end - self._len : end]
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self):
+        return iter(self.view())
+
+    def __getitem__(self, index):
+        return self.view()[index]
+
+
 # ====================================================================
 # Runtime state
 # ====================================================================
@@ -115,8 +266,11 @@ class ExperimentState:
     win: Any  # PsychoPy Window
     logger: DataLogger
     clock: Any  # PsychoPy Clock
-    buffer: deque
+    buffer: TraceBuffer
     stimuli: dict  # {"trace", "trace_border", "phase_title", ...}
+    # Scratch for the gain-adjusted trace (see apply_gain); sized to the
+    # trace buffer on construction when not given
+    gain_scratch: np.ndarray | None = None
     # Calibration results — updated by run_range_calibration
     range_center: float = 5.0
     global_amplitude: float = 2.0
@@ -127,6 +281,10 @@ class ExperimentState:
     # Frame counter (persists across phases within a trial)
     frame_count: int = 0
 
+    def __post_init__(self) -> None:
+        if self.gain_scratch is None:
+            self.gain_scratch = np.empty(self.buffer.maxlen)
+
 
 # ====================================================================
 # Phase functions
@@ -300,6 +458,7 @@ def run_range_calibration(state: ExperimentState, cfg: ExperimentConfig) -> bool
     s = state
     rc = cfg.range_cal
     escape = cfg.escape_key
+    escape_keys = [escape]
     cal_accepted = False
 
     while not cal_accepted:
@@ -320,41 +479,46 @@ def run_range_calibration(state: ExperimentState, cfg: ExperimentConfig) -> bool
             return False
 
         # Frame loop
-        range_cal_forces: list[float] = []
+        range_cal_chunks: list[np.ndarray] = []  # one array of forces per frame
         s.buffer.clear()
         s.stimuli["phase_title"].text = "RANGE CALIBRATION"
         s.clock.reset()
         s.frame_count = 0
         escaped = False
+        duration = cfg.timing.range_cal_duration_sec
+        status_text = s.stimuli["status_text"]
+        shown_secs = None  # countdown value currently on screen
 
-        while s.clock.getTime() < cfg.timing.range_cal_duration_sec:
+        while s.clock.getTime() < duration:
             s.frame_count += 1
             elapsed = s.clock.getTime()
 
-            new_samples = s.belt.get_all()
-            for _ts, force in new_samples:
-                s.buffer.append(force)
-                range_cal_forces.append(force)
-                s.logger.log_row(
+            _timestamps, forces = s.belt.get_all_arrays()
+            if forces.size:
+                s.buffer.extend(forces)
+                range_cal_chunks.append(forces)
+                s.logger.log_rows(
                     timestamp=round(elapsed, 4),
                     frame=s.frame_count,
-                    force_n=round(force, 4),
+                    force_n=np.round(forces, 4),
                     phase="range_cal",
                     condition="",
                     trial_num=0,
                     feedback_gain=1.0,
                 )
 
-            remaining = max(0, cfg.timing.range_cal_duration_sec - elapsed)
-            s.stimuli["status_text"].text = f"Breathe normally -- {remaining:.0f}s remaining"
+            secs = round(max(0, duration - elapsed))
+            if secs != shown_secs:
+                status_text.text = f"Breathe normally -- {secs}s remaining"
+                shown_secs = secs
 
             s.stimuli["trace_border"].draw()
-            s.stimuli["trace"].draw(list(s.buffer))
+            s.stimuli["trace"].draw(s.buffer.view())
             s.stimuli["phase_title"].draw()
-            s.stimuli["status_text"].draw()
+            status_text.draw()
             s.win.flip()
 
-            keys = check_keys([escape])
+            keys = check_keys(escape_keys)
             if keys:
                 print("Escape pressed during range calibration.")
                 escaped = True
@@ -364,27 +528,21 @@ def run_range_calibration(state: ExperimentState, cfg: ExperimentConfig) -> bool
             return False
 
         # Compute results
-        if not range_cal_forces:
+        if not range_cal_chunks:
             s.global_amplitude = 2.0
             s.range_center = 5.0
             print("Range calibration: no data collected, using defaults")
             return True
 
-        sorted_forces = sorted(range_cal_forces)
-        raw_min = sorted_forces[0]
-        raw_max = sorted_forces[-1]
+        range_cal_forces = np.concatenate(range_cal_chunks)
 
         # Saturation detection
-        saturated = any(
-            f <= rc.force_saturation_lo or f >= rc.force_saturation_hi for f in range_cal_forces
+        n_sat = np.count_nonzero(
+            (range_cal_forces <= rc.force_saturation_lo)
+            | (range_cal_forces >= rc.force_saturation_hi)
         )
         sat_warning = ""
-        if saturated:
-            n_sat = sum(
-                1
-                for f in range_cal_forces
-                if f <= rc.force_saturation_lo or f >= rc.force_saturation_hi
-            )
+        if n_sat:
             print(
                 f"[cal] WARNING: {n_sat} samples near sensor limits "
                 f"({rc.force_saturation_lo}-{rc.force_saturation_hi} N). "
@@ -392,14 +550,15 @@ def run_range_calibration(state: ExperimentState, cfg: ExperimentConfig) -> bool
             )
             sat_warning = "\n\nWARNING: Sensor saturation detected.\nConsider loosening the belt."
 
-        # Percentile clipping
-        n = len(sorted_forces)
+        # Percentile clipping: order statistics picked with one partial sort
+        n = len(range_cal_forces)
         lo_idx = int(n * rc.percentile_lo / 100)
         hi_idx = int(n * rc.percentile_hi / 100) - 1
         lo_idx = max(0, min(lo_idx, n - 1))
         hi_idx = max(lo_idx, min(hi_idx, n - 1))
-        global_min = sorted_forces[lo_idx]
-        global_max = sorted_forces[hi_idx]
+        ranks = [0, lo_idx, hi_idx, n - 1]
+        order_stats = np.partition(range_cal_forces, ranks)[ranks]
+        raw_min, global_min, global_max, raw_max = order_stats.tolist()
 
         raw_amplitude = (global_max - global_min) / 2.0
         s.global_amplitude = max(raw_amplitude * rc.scale, 0.5)
@@ -462,39 +621,46 @@ def run_baseline(
 
     s = state
     escape = cfg.escape_key
+    escape_keys = [escape]
     baseline_forces: list[float] = []
 
+    duration = cfg.timing.baseline_duration_sec
+    status_text = s.stimuli["status_text"]
+    shown_secs = None  # countdown value currently on screen
+
     s.stimuli["phase_title"].text = f"BASELINE -- Trial {trial_num}/{total_trials}"
     s.clock.reset()
 
-    while s.clock.getTime() < cfg.timing.baseline_duration_sec:
+    while s.clock.getTime() < duration:
         s.frame_count += 1
         elapsed = s.clock.getTime()
 
-        new_samples = s.belt.get_all()
-        for _ts, force in new_samples:
-            s.buffer.append(force)
-            baseline_forces.append(force)
-            s.logger.log_row(
+        _timestamps, forces = s.belt.get_all_arrays()
+        if forces.size:
+            s.buffer.extend(forces)
+            baseline_forces.extend(forces.tolist())
+            s.logger.log_rows(
                 timestamp=round(elapsed, 4),
                 frame=s.frame_count,
-                force_n=round(force, 4),
+                force_n=np.round(forces, 4),
                 phase="baseline",
                 condition=condition_name,
                 trial_num=trial_num,
                 feedback_gain=1.0,
             )
 
-        remaining = max(0, cfg.timing.baseline_duration_sec - elapsed)
-        s.stimuli["status_text"].text = f"Breathe naturally -- {remaining:.0f}s remaining"
+        secs = round(max(0, duration - elapsed))
+        if secs != shown_secs:
+            status_text.text = f"Breathe naturally -- {secs}s remaining"
+            shown_secs = secs
 
         s.stimuli["trace_border"].draw()
-        s.stimuli["trace"].draw(list(s.buffer))
+        s.stimuli["trace"].draw(s.buffer.view())
         s.stimuli["phase_title"].draw()
-        s.stimuli["status_text"].draw()
+        status_text.draw()
         s.win.flip()
 
-        keys = check_keys([escape])
+        keys = check_keys(escape_keys)
         if keys:
             print("Escape pressed during baseline.")
             return baseline_forces, True
@@ -520,31 +686,39 @@ def run_countdown(
 
     s = state
     escape = cfg.escape_key
+    escape_keys = [escape]
     feedback_gain = condition_def.feedback_gain
     trace_left, trace_bottom, trace_right, trace_top = cfg.trace.rect
     countdown_dur = cfg.timing.countdown_duration_sec
+    center = s.range_center
+    amplitude = s.global_amplitude
+    dot_x = trace_right + cfg.dot.x_offset
+    countdown_text = s.stimuli["countdown_text"]
+    shown_count = None  # number currently on screen
 
     s.stimuli["phase_title"].text = f"GET READY -- Trial {trial_num}/{total_trials}"
+    s.stimuli["status_text"].text = "Get ready -- follow the dot!"
     s.clock.reset()
 
     # Start dot at participant's current position, blend into target
     target_dot = s.stimuli["target_dot"]
     target_dot.fillColor = "#aaaaaa"
     target_dot.lineColor = "#aaaaaa"
-    current_force = s.buffer[-1] if s.buffer else s.range_center
-    first_freq = condition_def.segments[0].freq_hz
+    current_force = s.buffer[-1] if s.buffer else center
+    # Angular frequency of the first segment, for the preview waveform
+    omega = 2.0 * math.pi * condition_def.segments[0].freq_hz
 
     while s.clock.getTime() < countdown_dur:
         s.frame_count += 1
         elapsed = s.clock.getTime()
 
-        new_samples = s.belt.get_all()
-        for _ts, force in new_samples:
-            s.buffer.append(force)
-            s.logger.log_row(
+        _timestamps, forces = s.belt.get_all_arrays()
+        if forces.size:
+            s.buffer.extend(forces)
+            s.logger.log_rows(
                 timestamp=round(elapsed, 4),
                 frame=s.frame_count,
-                force_n=round(force, 4),
+                force_n=np.round(forces, 4),
                 phase="countdown",
                 condition=condition_name,
                 trial_num=trial_num,
@@ -553,29 +727,30 @@ def run_countdown(
 
         # Blend from current position into target waveform
         preview_t = elapsed - countdown_dur
-        extended_target = s.range_center + s.global_amplitude * np.sin(
-            2.0 * np.pi * first_freq * preview_t
-        )
+        extended_target = center + amplitude * math.sin(omega * preview_t)
         blend = elapsed / countdown_dur
         dot_force = current_force * (1.0 - blend) + extended_target * blend
 
         dot_y = _force_to_dot_y(dot_force, s.y_min, s.y_max, trace_bottom, trace_top)
-        target_dot.pos = (trace_right + cfg.dot.x_offset, dot_y)
+        target_dot.pos = (dot_x, dot_y)
 
         count_num = int(countdown_dur - elapsed) + 1
         count_num = max(1, min(count_num, int(countdown_dur)))
-        s.stimuli["countdown_text"].text = str(count_num)
-        s.stimuli["status_text"].text = "Get ready -- follow the dot!"
+        if count_num != shown_count:
+            countdown_text.text = str(count_num)
+            shown_count = count_num
 
         s.stimuli["trace_border"].draw()
-        s.stimuli["trace"].draw(apply_gain(s.buffer, feedback_gain, s.range_center))
+        s.stimuli["trace"].draw(
+            apply_gain(s.buffer.view(), feedback_gain, center, out=s.gain_scratch)
+        )
         target_dot.draw()
-        s.stimuli["countdown_text"].draw()
+        countdown_text.draw()
         s.stimuli["phase_title"].draw()
         s.stimuli["status_text"].draw()
         s.win.flip()
 
-        keys = check_keys([escape])
+        keys = check_keys(escape_keys)
         if keys:
             print("Escape pressed during countdown.")
             return True
@@ -591,12 +766,12 @@ def run_tracking(
     condition_name: str,
     trial_num: int,
     total_trials: int,
-) -> tuple[list[float], bool]:
+) -> tuple[np.ndarray, bool]:
     """Run the active tracking phase for one trial.
 
     Returns
     -------
-    trial_errors : list[float]
+    trial_errors : numpy.ndarray
         Absolute compensated errors for each sample.
     escaped : bool
     """
@@ -604,36 +779,54 @@ def run_tracking(
 
     s = state
     escape = cfg.escape_key
+    escape_keys = [escape]
     feedback_gain = condition_def.feedback_gain
     trace_left, trace_bottom, trace_right, trace_top = cfg.trace.rect
     target_dot = s.stimuli["target_dot"]
-    trial_errors: list[float] = []
+    duration = cfg.timing.tracking_duration_sec
+    # Sized for the expected sample count plus slack for timing jitter;
+    # grown below if the belt delivers more.
+    trial_errors = np.empty(int(duration * 1000 / cfg.belt.period_ms * 1.2) + 1)
+    n_errors = 0
+    center = s.range_center
+    dot_x = trace_right + cfg.dot.x_offset
+    status_text = s.stimuli["status_text"]
+    shown_secs = None  # countdown value currently on screen
+    # Dot colour currently applied; PsychoPy converts colours on every
+    # assignment, and most frames map to the same colour as the last.
+    shown_color = None
 
     s.stimuli["phase_title"].text = f"TRACKING -- Trial {trial_num}/{total_trials}"
     s.clock.reset()
 
-    while s.clock.getTime() < cfg.timing.tracking_duration_sec:
+    while s.clock.getTime() < duration:
         s.frame_count += 1
         tracking_t = s.clock.getTime()
 
         target_force = target_gen.get_target(tracking_t)
 
         latest_force = None
-        new_samples = s.belt.get_all()
-        for _ts, force in new_samples:
-            s.buffer.append(force)
-            latest_force = force
-            error = target_force - force
-            visual_force = s.range_center + feedback_gain * (force - s.range_center)
-            compensated_error = target_force - visual_force
-            trial_errors.append(abs(compensated_error))
-            s.logger.log_row(
+        _timestamps, forces = s.belt.get_all_arrays()
+        if forces.size:
+            s.buffer.extend(forces)
+            errors, compensated_errors = _tracking_errors(
+                forces, target_force, center, feedback_gain
+            )
+            end = n_errors + forces.size
+            if end > len(trial_errors):
+                grown = np.empty(max(end, 2 * len(trial_errors)))
+                grown[:n_errors] = trial_errors[:n_errors]
+                trial_errors = grown
+            np.abs(compensated_errors, out=trial_errors[n_errors:end])
+            n_errors = end
+            latest_force = forces[-1].item()
+            s.logger.log_rows(
                 timestamp=round(tracking_t, 4),
                 frame=s.frame_count,
-                force_n=round(force, 4),
+                force_n=np.round(forces, 4),
                 target_force=round(target_force, 4),
-                error=round(error, 4),
-                compensated_error=round(compensated_error, 4),
+                error=np.round(errors, 4),
+                compensated_error=np.round(compensated_errors, 4),
                 phase="tracking",
                 condition=condition_name,
                 trial_num=trial_num,
@@ -641,37 +834,43 @@ def run_tracking(
             )
 
         dot_y = _force_to_dot_y(target_force, s.y_min, s.y_max, trace_bottom, trace_top)
-        target_dot.pos = (trace_right + cfg.dot.x_offset, dot_y)
+        target_dot.pos = (dot_x, dot_y)
 
         if latest_force is not None:
-            visual_f = s.range_center + feedback_gain * (latest_force - s.range_center)
+            visual_f = center + feedback_gain * (latest_force - center)
             current_error = abs(target_force - visual_f)
             color = _compute_dot_color(current_error, cfg)
-            target_dot.fillColor = color
-            target_dot.lineColor = color
+            if color != shown_color:
+                target_dot.fillColor = color
+                target_dot.lineColor = color
+                shown_color = color
 
-        remaining = max(0, cfg.timing.tracking_duration_sec - tracking_t)
-        s.stimuli["status_text"].text = f"Follow the dot -- {remaining:.0f}s remaining"
+        secs = round(max(0, duration - tracking_t))
+        if secs != shown_secs:
+            status_text.text = f"Follow the dot -- {secs}s remaining"
+            shown_secs = secs
 
         s.stimuli["trace_border"].draw()
-        s.stimuli["trace"].draw(apply_gain(s.buffer, feedback_gain, s.range_center))
+        s.stimuli["trace"].draw(
+            apply_gain(s.buffer.view(), feedback_gain, center, out=s.gain_scratch)
+        )
         target_dot.draw()
         s.stimuli["phase_title"].draw()
-        s.stimuli["status_text"].draw()
+        status_text.draw()
         s.win.flip()
 
-        keys = check_keys([escape])
+        keys = check_keys(escape_keys)
         if keys:
             print("Escape pressed during tracking.")
-            return trial_errors, True
+            return trial_errors[:n_errors], True
 
-    return trial_errors, False
+    return trial_errors[:n_errors], False
 
 
 def show_trial_feedback(
     state: ExperimentState,
     cfg: ExperimentConfig,
-    trial_errors: list[float],
+    trial_errors: np.ndarray,
     trial_num: int,
 ) -> bool:
     """Show post-trial feedback screen.
@@ -680,7 +879,8 @@ def show_trial_feedback(
     """
     from respyra.core.display import show_text_and_wait
 
-    mean_abs_error = sum(trial_errors) / len(trial_errors) if trial_errors else float("nan")
+    trial_errors = np.asarray(trial_errors)
+    mean_abs_error = float(trial_errors.mean()) if trial_errors.size else float("nan")
     state.all_trial_errors.append(mean_abs_error)
 
     key = show_text_and_wait(
@@ -784,7 +984,7 @@ def run_experiment(cfg: ExperimentConfig | None = None) -> None:
 
         logger = DataLogger(filepath, columns=cfg.data_columns)
         exp_clock = core.Clock()
-        buffer = deque(maxlen=cfg.trace_buffer_size)
+        buffer = TraceBuffer(cfg.trace_buffer_size)
 
         state = ExperimentState(
             belt=belt,
@@ -20,6 +20,8 @@ Usage
 
 from __future__ import annotations
 
+import bisect
+import itertools
 import math
 from collections.abc import Sequence
 from dataclasses import dataclass, field
@@ -152,6 +154,10 @@ class TargetGenerator:
         self.center = center
         self.amplitude = amplitude
         self._total_duration = condition.total_duration
+        # Per-segment end times and angular frequencies, so get_target can
+        # bisect for the active segment instead of walking the list
+        self._seg_ends = list(itertools.accumulate(seg.duration for seg in condition.segments))
+        self._omegas = [2.0 * math.pi * seg.freq_hz for seg in condition.segments]
 
     def get_target(self, t: float) -> float:
         """Return the target force value at time *t* (seconds).
@@ -172,16 +178,11 @@ class TargetGenerator:
         # Wrap time into the repeating pattern
         t_wrapped = t % self._total_duration
 
-        # Walk segments to find the active one
-        elapsed_in_segments = 0.0
-        for seg in self.condition.segments:
-            seg_end = elapsed_in_segments + seg.duration
-            if t_wrapped < seg_end:
-                t_local = t_wrapped - elapsed_in_segments
-                return self.center + self.amplitude * math.sin(
-                    2.0 * math.pi * seg.freq_hz * t_local
-                )
-            elapsed_in_segments = seg_end
+        # Active segment: the first one ending after t_wrapped
+        i = bisect.bisect_right(self._seg_ends, t_wrapped)
+        if i < len(self._seg_ends):
+            t_local = t_wrapped - (self._seg_ends[i - 1] if i else 0.0)
+            return self.center + self.amplitude * math.sin(self._omegas[i] * t_local)
 
         # Floating-point edge case: t_wrapped exactly equals total_duration.
         # Fall back to the last segment's endpoint (sin at full cycle = 0).
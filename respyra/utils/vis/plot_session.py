@@ -224,7 +224,7 @@ def plot_session(df: pd.DataFrame, csv_path: str) -> plt.Figure:
 
     trial_stats = compute_trial_stats(df)
     baseline_cal = compute_baseline_cal(df)
-    tracking = df[df["phase"] == "tracking"].copy()
+    tracking = df[df["phase"] == "tracking"]
 
     _plot_full_trace(axes[0, 0], df)
     _plot_error_timeseries(axes[0, 1], tracking)
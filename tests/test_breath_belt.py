@@ -133,6 +133,24 @@ class TestBreathBeltQueue:
         assert result == samples
         assert belt._queue.empty()
 
+    def test_get_all_arrays_empty(self, _patch_gdx):
+        breath_belt, _ = _patch_gdx
+        belt = breath_belt.BreathBelt()
+        timestamps, forces = belt.get_all_arrays()
+        assert timestamps.size == 0
+        assert forces.size == 0
+
+    def test_get_all_arrays_splits_columns(self, _patch_gdx):
+        breath_belt, _ = _patch_gdx
+        belt = breath_belt.BreathBelt()
+        for s in [(1.0, 3.0), (2.0, 4.0), (3.0, 5.0)]:
+            belt._queue.put(s)
+        timestamps, forces = belt.get_all_arrays()
+        assert timestamps.tolist() == [1.0, 2.0, 3.0]
+        assert forces.tolist() == [3.0, 4.0, 5.0]
+        assert forces.flags.c_contiguous
+        assert belt._queue.empty()
+
 
 # ================================================================
 # Error propagation
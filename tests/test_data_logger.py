@@ -6,6 +6,9 @@ import csv
 import os
 from unittest.mock import patch
 
+import numpy as np
+import pytest
+
 from respyra.core.data_logger import DEFAULT_COLUMNS, DataLogger, create_session_file
 
 # ================================================================
@@ -114,6 +117,34 @@ class TestDataLogger:
             row = next(reader)
         assert row == ["1"]
 
+    def test_log_rows_broadcasts_scalars(self, tmp_path):
+        filepath = str(tmp_path / "test.csv")
+        cols = ["x", "y", "z"]
+        with DataLogger(filepath, columns=cols) as logger:
+            logger.log_rows(x=np.array([1.5, 2.5]), y="a", extra_key=[9, 9])
+
+        with open(filepath, newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))[1:]
+        assert rows == [["1.5", "a", ""], ["2.5", "a", ""]]
+
+    def test_log_rows_empty_sequence_writes_nothing(self, tmp_path):
+        filepath = str(tmp_path / "test.csv")
+        with DataLogger(filepath, columns=["x", "y"]) as logger:
+            logger.log_rows(x=[], y=1)
+
+        with open(filepath, newline="", encoding="utf-8") as f:
+            assert len(list(csv.reader(f))) == 1
+
+    def test_log_rows_rejects_mismatched_lengths(self, tmp_path):
+        filepath = str(tmp_path / "test.csv")
+        with DataLogger(filepath, columns=["x", "y"]) as logger, pytest.raises(ValueError):
+            logger.log_rows(x=[1, 2], y=[1, 2, 3])
+
+    def test_log_rows_requires_a_sequence(self, tmp_path):
+        filepath = str(tmp_path / "test.csv")
+        with DataLogger(filepath, columns=["x"]) as logger, pytest.raises(ValueError):
+            logger.log_rows(x=1)
+
     def test_log_sample_writes_all_fields(self, tmp_path):
         filepath = str(tmp_path / "test.csv")
         with DataLogger(filepath) as logger:
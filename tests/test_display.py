@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import numpy as np
 import pytest
@@ -73,6 +73,35 @@ class TestSignalTrace:
         ys = vertices[:, 1]
         np.testing.assert_allclose(ys, 0.25)  # clamped to top
 
+    def test_vertex_buffer_reused_for_same_length(self, trace):
+        trace.draw([1.0, 2.0, 3.0])
+        first = trace._shape.vertices
+        trace.draw([4.0, 5.0, 6.0])
+        assert trace._shape.vertices is first
+        np.testing.assert_allclose(first[:, 1], [-0.05, 0.0, 0.05])
+
+    def test_unchanged_data_skips_vertex_update(self, trace):
+        trace._shape = MagicMock()
+        vertices = PropertyMock()
+        type(trace._shape).vertices = vertices
+        trace.draw(np.array([1.0, 2.0, 3.0]))
+        trace.draw(np.array([1.0, 2.0, 3.0]))
+        assert vertices.call_count == 1
+        assert trace._shape.draw.call_count == 2
+        trace.draw(np.array([1.0, 2.0, 4.0]))
+        assert vertices.call_count == 2
+
+    def test_y_range_change_applies_next_frame(self, trace):
+        trace.draw([5.0, 5.0])
+        trace.y_min, trace.y_max = 5.0, 15.0
+        trace.draw([5.0, 5.0])
+        np.testing.assert_allclose(trace._shape.vertices[:, 1], -0.25)
+
+    def test_shape_created_without_autolog(self, trace):
+        from respyra.core import display
+
+        assert display.visual.ShapeStim.call_args.kwargs["autoLog"] is False
+
     def test_zero_y_span_maps_to_midpoint(self, mock_win):
         from respyra.core.display import SignalTrace
 
@@ -99,7 +128,7 @@ class TestDrawSignalTraceCache:
         display._signal_trace_cache.clear()
         mock_win = MagicMock()
         display.draw_signal_trace(mock_win, [1.0, 2.0, 3.0])
-        assert id(mock_win) in display._signal_trace_cache
+        assert [key[0] for key in display._signal_trace_cache] == [id(mock_win)]
 
     def test_cache_reuses_trace_on_same_params(self):
         from respyra.core import display
@@ -107,9 +136,9 @@ class TestDrawSignalTraceCache:
         display._signal_trace_cache.clear()
         mock_win = MagicMock()
         display.draw_signal_trace(mock_win, [1.0, 2.0])
-        first = display._signal_trace_cache[id(mock_win)]
+        (first,) = display._signal_trace_cache.values()
         display.draw_signal_trace(mock_win, [3.0, 4.0])
-        second = display._signal_trace_cache[id(mock_win)]
+        (second,) = display._signal_trace_cache.values()
         assert first is second
 
     def test_cache_invalidated_on_param_change(self):
@@ -118,12 +147,55 @@ class TestDrawSignalTraceCache:
         display._signal_trace_cache.clear()
         mock_win = MagicMock()
         display.draw_signal_trace(mock_win, [1.0, 2.0], y_range=(0, 10))
-        first = display._signal_trace_cache[id(mock_win)]
+        (first,) = display._signal_trace_cache.values()
         display.draw_signal_trace(mock_win, [1.0, 2.0], y_range=(0, 50))
-        second = display._signal_trace_cache[id(mock_win)]
+        (second,) = display._signal_trace_cache.values()
         assert first is not second
 
 
+# ================================================================
+# create_monitor
+# ================================================================
+
+
+class TestCreateMonitor:
+    def _mock_monitor(self, width, distance, size):
+        mon = MagicMock()
+        mon.getWidth.return_value = width
+        mon.getDistance.return_value = distance
+        mon.getSizePix.return_value = size
+        return mon
+
+    def test_matching_profile_is_not_saved(self):
+        from respyra.core.display import create_monitor
+
+        mon = self._mock_monitor(53.0, 57.0, [1920, 1080])
+        with patch("respyra.core.display.monitors") as mock_monitors:
+            mock_monitors.Monitor.return_value = mon
+            result = create_monitor("lab", 53.0, 57.0, (1920, 1080))
+        assert result is mon
+        mon.save.assert_not_called()
+
+    def test_changed_profile_is_saved(self):
+        from respyra.core.display import create_monitor
+
+        mon = self._mock_monitor(53.0, 57.0, [1920, 1080])
+        with patch("respyra.core.display.monitors") as mock_monitors:
+            mock_monitors.Monitor.return_value = mon
+            create_monitor("lab", 60.0, 57.0, (1920, 1080))
+        mon.setWidth.assert_called_once_with(60.0)
+        mon.save.assert_called_once()
+
+    def test_new_profile_is_saved(self):
+        from respyra.core.display import create_monitor
+
+        mon = self._mock_monitor(None, None, None)
+        with patch("respyra.core.display.monitors") as mock_monitors:
+            mock_monitors.Monitor.return_value = mon
+            create_monitor("lab", 53.0, 57.0, (1920, 1080))
+        mon.save.assert_called_once()
+
+
 # ================================================================
 # show_text_and_wait
 # ================================================================
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
-from respyra.core.events import check_keys, record_event, wait_for_key
+from respyra.core.events import EventLog, check_keys, record_event, wait_for_key
 
 # ================================================================
 # record_event (pure function — no mocking needed)
@@ -40,6 +40,36 @@ class TestRecordEvent:
         assert log[0]["event_type"] == "existing"
 
 
+class TestEventLog:
+    def test_record_and_len(self):
+        log = EventLog()
+        log.record("start", 0.0)
+        log.record("response", 1.2, key="space")
+        assert len(log) == 2
+        assert log.event_types == ["start", "response"]
+        assert log.timestamps == [0.0, 1.2]
+
+    def test_columns_fill_missing_extras(self):
+        log = EventLog()
+        log.record("start", 0.0)
+        log.record("response", 1.2, key="space", rt=0.4)
+        assert log.columns() == {
+            "event_type": ["start", "response"],
+            "timestamp": [0.0, 1.2],
+            "key": [None, "space"],
+            "rt": [None, 0.4],
+        }
+
+    def test_iterates_as_record_dicts(self):
+        log = EventLog()
+        record_event(log, "start", 0.0)
+        record_event(log, "response", 1.2, key="space")
+        assert list(log) == [
+            {"event_type": "start", "timestamp": 0.0},
+            {"event_type": "response", "timestamp": 1.2, "key": "space"},
+        ]
+
+
 # ================================================================
 # check_keys (mocked psychopy.event)
 # ================================================================
@@ -90,6 +120,12 @@ class TestWaitForKey:
             result = wait_for_key(max_wait=1.0)
         assert result is None
 
+    def test_returns_none_on_empty_result(self):
+        with patch("respyra.core.events.event") as mock_event:
+            mock_event.waitKeys.return_value = []
+            result = wait_for_key(max_wait=1.0)
+        assert result is None
+
     def test_passes_max_wait(self):
         with patch("respyra.core.events.event") as mock_event:
             mock_event.waitKeys.return_value = None
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import textwrap
-from dataclasses import replace
+from dataclasses import FrozenInstanceError, replace
 
 import pytest
 
@@ -16,6 +16,7 @@ from respyra.configs.experiment_config import (
     TimingConfig,
     TraceConfig,
     TrialConfig,
+    lazy_config_getattr,
     load_config,
 )
 from respyra.core.target_generator import ConditionDef, SegmentDef
@@ -47,18 +48,32 @@ class TestExperimentConfig:
         )
         assert cfg.trace_buffer_size == 500
 
+    def test_trace_buffer_size_follows_replace(self):
+        cfg = ExperimentConfig(trace=TraceConfig(duration_sec=5.0))
+        cfg2 = replace(cfg, belt=BeltConfig(period_ms=50))
+        assert cfg2.trace_buffer_size == 100
+        assert cfg.trace_buffer_size == 50
+
     def test_data_columns_default(self):
         cfg = ExperimentConfig()
         assert "timestamp" in cfg.data_columns
         assert "force_n" in cfg.data_columns
         assert "phase" in cfg.data_columns
 
-    def test_data_columns_independent(self):
-        """Each instance gets its own copy of data_columns."""
-        cfg1 = ExperimentConfig()
-        cfg2 = ExperimentConfig()
-        cfg1.data_columns.append("extra")
-        assert "extra" not in cfg2.data_columns
+    def test_data_columns_default_is_immutable(self):
+        """The shared default data_columns cannot be mutated in place."""
+        cfg = ExperimentConfig()
+        assert isinstance(cfg.data_columns, tuple)
+        with pytest.raises(AttributeError):
+            cfg.data_columns.append("extra")
+
+    def test_config_is_frozen(self):
+        """Fields are changed with replace(), not assignment."""
+        cfg = ExperimentConfig()
+        with pytest.raises(FrozenInstanceError):
+            cfg.name = "Changed"
+        with pytest.raises(FrozenInstanceError):
+            cfg.timing.tracking_duration_sec = 60.0
 
 
 # ------------------------------------------------------------------ #
@@ -71,7 +86,7 @@ class TestSubConfigs:
         bc = BeltConfig()
         assert bc.connection == "ble"
         assert bc.period_ms == 100
-        assert bc.channels == [1]
+        assert bc.channels == (1,)
 
     def test_display_defaults(self):
         dc = DisplayConfig()
@@ -101,7 +116,7 @@ class TestSubConfigs:
 
     def test_trial_defaults(self):
         tc = TrialConfig()
-        assert tc.conditions == []
+        assert tc.conditions == ()
         assert tc.n_reps == 1
         assert tc.build_conditions is None
 
@@ -212,6 +227,22 @@ class TestLoadConfig:
         load_config(str(config_file))
         assert sys.path == path_before
 
+    def test_load_from_file_keeps_existing_sys_path_entry(self, tmp_path, monkeypatch):
+        """A parent directory already on sys.path is left in place."""
+        import sys
+
+        config_file = tmp_path / "on_path_config.py"
+        config_file.write_text(
+            textwrap.dedent("""\
+            from respyra.configs.experiment_config import ExperimentConfig
+            CONFIG = ExperimentConfig(name="OnPath")
+            """)
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        path_before = list(sys.path)
+        load_config(str(config_file))
+        assert sys.path == path_before
+
     def test_load_short_name_demo(self):
         """Short name 'demo' resolves to respyra.configs.demo."""
         cfg = load_config("demo")
@@ -223,6 +254,91 @@ class TestLoadConfig:
         cfg = load_config("respyra.configs.demo")
         assert isinstance(cfg, ExperimentConfig)
 
+    def test_builtin_config_is_built_lazily_and_cached(self):
+        """Built-in config modules build CONFIG on first access, once."""
+        import respyra.configs.demo as demo
+
+        cfg = demo.CONFIG
+        assert isinstance(cfg, ExperimentConfig)
+        assert demo.CONFIG is cfg
+        with pytest.raises(AttributeError):
+            _ = demo.NOT_A_SETTING
+
+    def test_lazy_config_getattr_builds_once(self):
+        """The shared hook builds CONFIG on first access and stores it."""
+        calls = []
+        namespace = {"__name__": "fake_config"}
+
+        def build():
+            calls.append(1)
+            return ExperimentConfig(name="Lazy")
+
+        getattr_hook = lazy_config_getattr(namespace, build)
+        cfg = getattr_hook("CONFIG")
+        assert cfg.name == "Lazy"
+        assert namespace["CONFIG"] is cfg
+        assert len(calls) == 1
+        with pytest.raises(AttributeError, match="fake_config"):
+            getattr_hook("OTHER")
+
+    def test_validation_study_inherits_base_constants(self):
+        """Constants not overridden by validation_study come from the base."""
+        import respyra.configs.breath_tracking as base
+        import respyra.configs.validation_study as vs
+
+        assert vs.BELT_PERIOD_MS == base.BELT_PERIOD_MS
+        assert vs.TRACE_RECT == base.TRACE_RECT
+        assert vs.FULLSCR is True
+        assert vs.CONFIG.timing.tracking_duration_sec == 40.0
+        with pytest.raises(AttributeError):
+            _ = vs.NOT_A_SETTING
+
+    def test_load_from_file_is_memoized(self, tmp_path):
+        """A second load of an unchanged file returns the cached instance."""
+        config_file = tmp_path / "memo_config.py"
+        config_file.write_text(
+            textwrap.dedent("""\
+            from respyra.configs.experiment_config import ExperimentConfig
+            CONFIG = ExperimentConfig(name="Memo")
+            """)
+        )
+        first = load_config(str(config_file))
+        assert load_config(str(config_file)) is first
+
+    def test_load_from_file_reloads_after_edit(self, tmp_path):
+        """Editing the file (new mtime) invalidates the cached config."""
+        import os
+
+        config_file = tmp_path / "edited_config.py"
+        config_file.write_text(
+            "from respyra.configs.experiment_config import ExperimentConfig\n"
+            "CONFIG = ExperimentConfig(name='Before')\n"
+        )
+        assert load_config(str(config_file)).name == "Before"
+        config_file.write_text(
+            "from respyra.configs.experiment_config import ExperimentConfig\n"
+            "CONFIG = ExperimentConfig(name='After')\n"
+        )
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert load_config(str(config_file)).name == "After"
+
+    def test_cache_clear_reexecutes_file_configs(self, tmp_path):
+        """After cache_clear a file config is re-executed, a module config is not."""
+        config_file = tmp_path / "cleared_config.py"
+        config_file.write_text(
+            "from respyra.configs.experiment_config import ExperimentConfig\n"
+            "CONFIG = ExperimentConfig(name='Cleared')\n"
+        )
+        first_file = load_config(str(config_file))
+        first_module = load_config("demo")
+        load_config.cache_clear()
+        reloaded = load_config(str(config_file))
+        assert reloaded is not first_file
+        assert reloaded == first_file
+        # Module configs come from the module already in sys.modules
+        assert load_config("demo") is first_module
+
     def test_load_short_name_nonexistent_raises(self):
         """Short name that doesn't map to a real module raises ImportError."""
         with pytest.raises((ImportError, ModuleNotFoundError)):
@@ -3,20 +3,104 @@
 from __future__ import annotations
 
 import colorsys
+from collections import deque
 
+import numpy as np
 import pytest
 
 from respyra.configs.experiment_config import DotConfig, ExperimentConfig
 from respyra.core.runner import (
+    ExperimentState,
+    TraceBuffer,
     _compute_dot_color,
     _force_to_dot_y,
+    _tracking_errors,
     apply_gain,
     graded_dot_color,
 )
 
 
+class TestTraceBuffer:
+    def test_empty(self):
+        buf = TraceBuffer(3)
+        assert len(buf) == 0
+        assert not buf
+        assert buf.view().size == 0
+
+    def test_partial_fill_in_order(self):
+        buf = TraceBuffer(3)
+        buf.append(1.0)
+        buf.append(2.0)
+        assert buf.view().tolist() == [1.0, 2.0]
+        assert buf[-1] == 2.0
+
+    def test_wraps_like_deque(self):
+        buf = TraceBuffer(3)
+        ref = deque(maxlen=3)
+        for value in range(1, 9):
+            buf.append(float(value))
+            ref.append(float(value))
+            assert list(buf) == list(ref)
+            assert buf[-1] == ref[-1]
+
+    def test_extend_matches_deque(self):
+        buf = TraceBuffer(4)
+        ref = deque(maxlen=4)
+        value = 0.0
+        for n in [0, 1, 3, 2, 4, 5, 1, 9, 0, 3]:
+            batch = [value + i for i in range(n)]
+            value += n
+            buf.extend(np.array(batch))
+            ref.extend(batch)
+            assert list(buf) == list(ref)
+        buf.append(99.0)
+        ref.append(99.0)
+        assert list(buf) == list(ref)
+
+    def test_view_is_contiguous_without_copy(self):
+        buf = TraceBuffer(4)
+        for value in range(6):
+            buf.append(float(value))
+        view = buf.view()
+        assert view.flags["C_CONTIGUOUS"]
+        assert np.shares_memory(view, buf._data)
+        assert view.tolist() == [2.0, 3.0, 4.0, 5.0]
+
+    def test_clear(self):
+        buf = TraceBuffer(2)
+        buf.append(1.0)
+        buf.append(2.0)
+        buf.append(3.0)
+        buf.clear()
+        assert len(buf) == 0
+        buf.append(4.0)
+        assert buf.view().tolist() == [4.0]
+
+
+class TestExperimentState:
+    def test_gain_scratch_sized_to_buffer(self):
+        state = ExperimentState(
+            belt=None, win=None, logger=None, clock=None, buffer=TraceBuffer(8), stimuli={}
+        )
+        assert state.gain_scratch.shape == (8,)
+
+    def test_gain_scratch_kept_when_given(self):
+        scratch = np.empty(16)
+        state = ExperimentState(
+            belt=None,
+            win=None,
+            logger=None,
+            clock=None,
+            buffer=TraceBuffer(8),
+            stimuli={},
+            gain_scratch=scratch,
+        )
+        assert state.gain_scratch is scratch
+
+
 class TestApplyGain:
-    def test_gain_one_returns_copy(self):
+    def test_gain_one_list_input_returns_new_array(self):
+        """A list is converted to an array; array inputs are not copied."""
         buf = [1.0, 2.0, 3.0]
         result = apply_gain(buf, 1.0, 2.0)
         assert result == pytest.approx([1.0, 2.0, 3.0])
@@ -44,16 +128,26 @@ class TestApplyGain:
         assert result == pytest.approx([5.0, 5.0, 5.0])
 
     def test_empty_buffer(self):
-        assert apply_gain([], 2.0, 5.0) == []
+        assert apply_gain([], 2.0, 5.0).size == 0
 
     def test_works_with_deque(self):
         from collections import deque
 
         buf = deque([1.0, 2.0, 3.0])
         result = apply_gain(buf, 1.0, 2.0)
-        assert isinstance(result, list)
+        assert isinstance(result, np.ndarray)
         assert result == pytest.approx([1.0, 2.0, 3.0])
 
+    def test_writes_into_out(self):
+        out = np.zeros(5)
+        result = apply_gain(np.array([4.0, 5.0, 6.0]), 2.0, 5.0, out=out)
+        assert np.shares_memory(result, out)
+        assert result == pytest.approx([3.0, 5.0, 7.0])
+
+    def test_unity_gain_does_not_copy_array(self):
+        buf = np.array([1.0, 2.0, 3.0])
+        assert np.shares_memory(apply_gain(buf, 1.0, 2.0), buf)
+
 
 class TestGradedDotColor:
     def test_zero_error_is_green(self):
@@ -87,15 +181,23 @@ class TestGradedDotColor:
         t = (0.5) ** 0.5
         hue = (1.0 - t) / 3.0
         exp_r, exp_g, exp_b = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-        assert r == pytest.approx(exp_r * 2 - 1)
-        assert g == pytest.approx(exp_g * 2 - 1)
-        assert b == pytest.approx(exp_b * 2 - 1)
+        # Colours come from a 4097-entry table, so allow its step size.
+        assert r == pytest.approx(exp_r * 2 - 1, abs=1e-3)
+        assert g == pytest.approx(exp_g * 2 - 1, abs=1e-3)
+        assert b == pytest.approx(exp_b * 2 - 1, abs=1e-3)
 
     def test_returns_tuple_of_three(self):
         result = graded_dot_color(1.0, 3.0)
         assert len(result) == 3
         assert all(isinstance(v, float) for v in result)
 
+    def test_matches_direct_hsv_within_quantisation(self):
+        for error in np.linspace(0.0, 3.0, 301).tolist():
+            t = (error / 3.0) ** 0.5
+            exp = colorsys.hsv_to_rgb((1.0 - t) / 3.0, 1.0, 1.0)
+            got = graded_dot_color(error, 3.0)
+            assert got == pytest.approx([c * 2 - 1 for c in exp], abs=1e-3)
+
     def test_values_in_psychopy_range(self):
         """All colour values should be in [-1, 1]."""
         for error in [0.0, 0.5, 1.0, 2.0, 3.0, 5.0]:
@@ -135,6 +237,19 @@ class TestForceToDotY:
         assert y == pytest.approx(0.25)
 
 
+class TestTrackingErrors:
+    def test_unity_gain_errors_match(self):
+        error, comp = _tracking_errors(np.array([4.0, 6.0]), 5.0, 5.0, 1.0)
+        assert error == pytest.approx([1.0, -1.0])
+        assert comp == pytest.approx([1.0, -1.0])
+
+    def test_compensated_error_uses_displayed_force(self):
+        # Displayed force: 5.0 + 2.0 * (6.0 - 5.0) = 7.0
+        error, comp = _tracking_errors(np.array([6.0]), 6.5, 5.0, 2.0)
+        assert error == pytest.approx([0.5])
+        assert comp == pytest.approx([-0.5])
+
+
 class TestComputeDotColor:
     def test_graded_mode(self):
         cfg = ExperimentConfig(dot=DotConfig(feedback_mode="graded", graded_max_error_n=3.0))